@@ -5,9 +5,10 @@ Analyzes F1 data and calculates prediction scores based on multiple factors
 including driver form, team performance, circuit history, and qualifying results.
 """
 
+import heapq
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime
+from collections import defaultdict
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple
 
 from f1_predictor.models import (
     Race, Driver, Constructor, RaceResult, QualifyingResult,
@@ -15,11 +16,26 @@ from f1_predictor.models import (
 )
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class ResultSummary(NamedTuple):
+    """Finishing statistics for one driver over a set of race results."""
+    races: int
+    wins: int
+    podiums: int  # Top 3 finishes, including wins
+    points_finishes: int  # Top 10 finishes, including podiums
+    avg_position: float
+
+
+class StandingsContext(NamedTuple):
+    """Per-analysis constants derived once from a standings table."""
+    standings_by_id: Dict[str, Any]  # First standing for each driver/constructor ID
+    slope: float  # Position score drop per place (100 / number of entries)
+    leader_points: float  # Points of the first entry
+    total_wins: int  # Sum of wins across all entries
+
+
 class PredictionAnalyzer:
     """
     Analyzes F1 data to generate race winner predictions.
@@ -42,14 +58,42 @@ class PredictionAnalyzer:
     # Configuration
     RECENT_RACES_COUNT = 5  # Number of recent races to consider for form
     
+    # Form points indexed by finishing position (index 0 unused, P11+ score 0)
+    FORM_POINTS = (0, 25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+    FORM_DNF_PENALTY = -2
+    
+    # Form normalization bounds over RECENT_RACES_COUNT races (all wins / all DNFs)
+    FORM_MAX_POINTS = FORM_POINTS[1] * RECENT_RACES_COUNT
+    FORM_MIN_POINTS = FORM_DNF_PENALTY * RECENT_RACES_COUNT
+    FORM_POINTS_RANGE = FORM_MAX_POINTS - FORM_MIN_POINTS
+    
+    # Qualifying impact indexed by grid position (index 0 unused, P21+ score 0)
+    QUALIFYING_SCORES = (
+        50.0, 100.0, 90.0, 80.0, 70.0, 70.0, 50.0, 50.0, 50.0, 50.0, 50.0,
+        45.0, 40.0, 35.0, 30.0, 25.0, 20.0, 15.0, 10.0, 5.0, 0.0
+    )
+    
+    # Sources counted by calculate_data_completeness()
+    DATA_SOURCE_COUNT = 5
+    
     def __init__(self):
         """Initialize the prediction analyzer."""
-        pass
+        # Default weights in canonical factor order, built once per analyzer
+        self.default_weights: Dict[str, float] = {
+            'championship': self.WEIGHT_CHAMPIONSHIP,
+            'form': self.WEIGHT_FORM,
+            'team': self.WEIGHT_TEAM,
+            'qualifying': self.WEIGHT_QUALIFYING,
+            'circuit': self.WEIGHT_CIRCUIT
+        }
+        # Weight of the three always-present factors, summed in canonical order
+        self._core_weight = self.WEIGHT_CHAMPIONSHIP + self.WEIGHT_FORM + self.WEIGHT_TEAM
     
     def calculate_driver_form(
         self,
         driver: Driver,
-        recent_results: List[RaceResult]
+        recent_results: List[RaceResult],
+        driver_results: Optional[List[RaceResult]] = None
     ) -> float:
         """
         Calculate driver's recent form score based on last N races.
@@ -64,6 +108,8 @@ class PredictionAnalyzer:
         Args:
             driver: Driver to calculate form for
             recent_results: List of recent race results (should be last 5 races)
+            driver_results: Optional pre-filtered results for this driver, sorted
+                most recent first (skips filtering and sorting)
             
         Returns:
             Form score from 0-100
@@ -71,63 +117,48 @@ class PredictionAnalyzer:
         if not recent_results:
             return 50.0  # Neutral score if no data
         
-        # Filter results for this driver and get most recent races
-        driver_results = [
-            r for r in recent_results
-            if r.driver.driver_id == driver.driver_id
-        ]
+        if driver_results is None:
+            # Filter results for this driver and get most recent races
+            driver_id = driver.driver_id
+            driver_results = [
+                r for r in recent_results
+                if r.driver_id == driver_id
+            ]
+            
+            # Sort by race date (most recent first)
+            driver_results.sort(key=lambda r: r.race.date_ord, reverse=True)
         
-        # Sort by race date (most recent first) and take last N races
-        driver_results.sort(key=lambda r: r.race.date, reverse=True)
+        # Take last N races
         driver_results = driver_results[:self.RECENT_RACES_COUNT]
         
         if not driver_results:
             return 50.0  # Neutral score if no driver data
         
-        # Calculate points based on positions
-        total_points = 0.0
+        # Calculate points based on positions (integer sum, converted once below)
+        form_points = self.FORM_POINTS
+        max_scoring_position = len(form_points) - 1
+        total_points = 0
         for result in driver_results:
-            if result.status != "Finished" and result.position > 10:
+            position = result.position
+            if result.status != "Finished" and position > 10:
                 # DNF or DNS
-                total_points += -2
-            elif result.position == 1:
-                total_points += 25
-            elif result.position == 2:
-                total_points += 18
-            elif result.position == 3:
-                total_points += 15
-            elif result.position == 4:
-                total_points += 12
-            elif result.position == 5:
-                total_points += 10
-            elif result.position == 6:
-                total_points += 8
-            elif result.position == 7:
-                total_points += 6
-            elif result.position == 8:
-                total_points += 4
-            elif result.position == 9:
-                total_points += 2
-            elif result.position == 10:
-                total_points += 1
-            else:
-                total_points += 0
+                total_points += self.FORM_DNF_PENALTY
+            elif 0 < position <= max_scoring_position:
+                total_points += form_points[position]
         
         # Normalize to 0-100 scale
         # Maximum possible: 25 * 5 = 125 points
         # Minimum possible: -2 * 5 = -10 points
-        max_points = 25 * self.RECENT_RACES_COUNT
-        min_points = -2 * self.RECENT_RACES_COUNT
-        
         # Shift to 0-based scale and normalize
-        normalized = ((total_points - min_points) / (max_points - min_points)) * 100
+        normalized = ((total_points - self.FORM_MIN_POINTS) / self.FORM_POINTS_RANGE) * 100
         
         return max(0.0, min(100.0, normalized))
     
     def calculate_team_performance(
         self,
         constructor: Constructor,
-        standings: List[ConstructorStanding]
+        standings: List[ConstructorStanding],
+        context: Optional[StandingsContext] = None
     ) -> float:
         """
         Calculate team performance score based on constructor standings.
@@ -139,6 +170,7 @@ class PredictionAnalyzer:
         Args:
             constructor: Constructor to calculate performance for
             standings: List of constructor standings
+            context: Optional precomputed context from build_team_context()
             
         Returns:
             Team performance score from 0-100
@@ -146,22 +178,20 @@ class PredictionAnalyzer:
         if not standings:
             return 50.0  # Neutral score if no data
         
+        if context is None:
+            context = self.build_team_context(standings)
+        
         # Find constructor in standings
-        constructor_standing = None
-        for standing in standings:
-            if standing.constructor.constructor_id == constructor.constructor_id:
-                constructor_standing = standing
-                break
+        constructor_standing = context.standings_by_id.get(constructor.constructor_id)
         
         if not constructor_standing:
             return 50.0  # Neutral score if constructor not found
         
         # Base score from position (1st = 100, decreasing by 10 per position)
-        num_teams = len(standings)
-        position_score = max(0, 100 - ((constructor_standing.position - 1) * (100 / num_teams)))
+        position_score = max(0, 100 - ((constructor_standing.position - 1) * context.slope))
         
         # Bonus for wins (up to 10% boost)
-        total_wins = sum(s.wins for s in standings)
+        total_wins = context.total_wins
         if total_wins > 0:
             win_ratio = constructor_standing.wins / total_wins
             win_bonus = win_ratio * 10
@@ -175,7 +205,8 @@ class PredictionAnalyzer:
         self,
         driver: Driver,
         circuit: str,
-        history: List[RaceResult]
+        history: List[RaceResult],
+        driver_results: Optional[List[RaceResult]] = None
     ) -> float:
         """
         Calculate driver's historical performance advantage at specific circuit.
@@ -190,6 +221,7 @@ class PredictionAnalyzer:
             driver: Driver to calculate circuit advantage for
             circuit: Circuit ID
             history: List of historical race results at this circuit
+            driver_results: Optional pre-filtered history for this driver (skips filtering)
             
         Returns:
             Circuit advantage score from 0-100
@@ -198,34 +230,40 @@ class PredictionAnalyzer:
             return 50.0  # Neutral score if no history
         
         # Filter results for this driver at this circuit
-        driver_history = [
-            r for r in history
-            if r.driver.driver_id == driver.driver_id
-        ]
+        if driver_results is not None:
+            driver_history = driver_results
+        else:
+            driver_id = driver.driver_id
+            driver_history = [
+                r for r in history
+                if r.driver_id == driver_id
+            ]
         
         if not driver_history:
             return 50.0  # Neutral score if driver has no history at circuit
         
+        return self._score_circuit_summary(self.summarize_results(driver_history))
+    
+    def _score_circuit_summary(self, summary: ResultSummary) -> float:
+        """
+        Convert a driver's circuit result summary into a circuit advantage score.
+        
+        Args:
+            summary: Summary of the driver's results at the circuit
+            
+        Returns:
+            Circuit advantage score from 0-100
+        """
         # Calculate points based on historical performance
-        total_points = 0.0
-        wins = 0
-        podiums = 0
-        points_finishes = 0
-        
-        for result in driver_history:
-            if result.position == 1:
-                total_points += 30
-                wins += 1
-            elif result.position <= 3:
-                total_points += 15
-                podiums += 1
-            elif result.position <= 10:
-                total_points += 5
-                points_finishes += 1
+        total_points = float(
+            summary.wins * 30
+            + (summary.podiums - summary.wins) * 15
+            + (summary.points_finishes - summary.podiums) * 5
+        )
         
         # Normalize based on number of races at circuit
         # More races = more reliable data
-        num_races = len(driver_history)
+        num_races = summary.races
         if num_races > 0:
             avg_points = total_points / num_races
             # Scale to 0-100 (assuming max average of 30 points per race)
@@ -256,25 +294,17 @@ class PredictionAnalyzer:
         if qualifying_position <= 0:
             return 50.0  # Neutral score for invalid position
         
-        if qualifying_position == 1:
-            return 100.0
-        elif qualifying_position == 2:
-            return 90.0
-        elif qualifying_position == 3:
-            return 80.0
-        elif qualifying_position <= 5:
-            return 70.0
-        elif qualifying_position <= 10:
-            return 50.0
-        else:
-            # Decreasing score for positions beyond top 10
-            score = max(0, 50 - ((qualifying_position - 10) * 5))
-            return float(score)
+        if qualifying_position < len(self.QUALIFYING_SCORES):
+            return self.QUALIFYING_SCORES[qualifying_position]
+        
+        # Score has already decreased to zero beyond the table
+        return 0.0
     
     def calculate_championship_score(
         self,
         driver: Driver,
-        standings: List[DriverStanding]
+        standings: List[DriverStanding],
+        context: Optional[StandingsContext] = None
     ) -> float:
         """
         Calculate score based on driver's championship position.
@@ -286,6 +316,7 @@ class PredictionAnalyzer:
         Args:
             driver: Driver to calculate championship score for
             standings: List of driver standings
+            context: Optional precomputed context from build_championship_context()
             
         Returns:
             Championship score from 0-100
@@ -293,22 +324,20 @@ class PredictionAnalyzer:
         if not standings:
             return 50.0  # Neutral score if no data
         
+        if context is None:
+            context = self.build_championship_context(standings)
+        
         # Find driver in standings
-        driver_standing = None
-        for standing in standings:
-            if standing.driver.driver_id == driver.driver_id:
-                driver_standing = standing
-                break
+        driver_standing = context.standings_by_id.get(driver.driver_id)
         
         if not driver_standing:
             return 50.0  # Neutral score if driver not found
         
         # Base score from position
-        num_drivers = len(standings)
-        position_score = max(0, 100 - ((driver_standing.position - 1) * (100 / num_drivers)))
+        position_score = max(0, 100 - ((driver_standing.position - 1) * context.slope))
         
         # Adjust by points gap to leader
-        leader_points = standings[0].points if standings else 0
+        leader_points = context.leader_points
         if leader_points > 0:
             points_ratio = driver_standing.points / leader_points
             # Apply points ratio as a multiplier (0.5 to 1.0 range)
@@ -317,6 +346,54 @@ class PredictionAnalyzer:
         
         return max(0.0, min(100.0, position_score))
 
+    @staticmethod
+    def build_championship_context(standings: List[DriverStanding]) -> StandingsContext:
+        """
+        Precompute lookup and scaling constants for championship scoring.
+        
+        Args:
+            standings: List of driver standings (leader first)
+            
+        Returns:
+            StandingsContext keyed by driver ID
+        """
+        standings_by_id: Dict[str, DriverStanding] = {}
+        for standing in standings:
+            # setdefault keeps the first entry, matching a front-to-back search
+            if standing.driver:
+                standings_by_id.setdefault(standing.driver.driver_id, standing)
+        
+        return StandingsContext(
+            standings_by_id=standings_by_id,
+            slope=100 / len(standings) if standings else 0.0,
+            leader_points=standings[0].points if standings else 0,
+            total_wins=sum(s.wins for s in standings)
+        )
+    
+    @staticmethod
+    def build_team_context(standings: List[ConstructorStanding]) -> StandingsContext:
+        """
+        Precompute lookup and scaling constants for team performance scoring.
+        
+        Args:
+            standings: List of constructor standings (leader first)
+            
+        Returns:
+            StandingsContext keyed by constructor ID
+        """
+        standings_by_id: Dict[str, ConstructorStanding] = {}
+        for standing in standings:
+            # setdefault keeps the first entry, matching a front-to-back search
+            if standing.constructor:
+                standings_by_id.setdefault(standing.constructor.constructor_id, standing)
+        
+        return StandingsContext(
+            standings_by_id=standings_by_id,
+            slope=100 / len(standings) if standings else 0.0,
+            leader_points=standings[0].points if standings else 0,
+            total_wins=sum(s.wins for s in standings)
+        )
+    
     def combine_factors(
         self,
         factors: Dict[str, float],
@@ -344,13 +421,7 @@ class PredictionAnalyzer:
         
         # Use default weights if not provided
         if weights is None:
-            weights = {
-                'championship': self.WEIGHT_CHAMPIONSHIP,
-                'form': self.WEIGHT_FORM,
-                'team': self.WEIGHT_TEAM,
-                'qualifying': self.WEIGHT_QUALIFYING,
-                'circuit': self.WEIGHT_CIRCUIT
-            }
+            weights = self.default_weights
         
         # Calculate weighted sum
         total_score = 0.0
@@ -369,6 +440,84 @@ class PredictionAnalyzer:
         
         return max(0.0, min(100.0, final_score))
     
+    def _combine_scores(
+        self,
+        championship: float,
+        form: float,
+        team: float,
+        qualifying: Optional[float] = None,
+        circuit: Optional[float] = None
+    ) -> float:
+        """
+        Combine the canonical factors with the default weights.
+        
+        Equivalent to combine_factors() with default weights for a factors dict
+        in canonical order, without the per-factor dict lookups.
+        
+        Args:
+            championship: Championship score (0-100)
+            form: Recent form score (0-100)
+            team: Team performance score (0-100)
+            qualifying: Qualifying score, or None if not available
+            circuit: Circuit advantage score, or None if not available
+            
+        Returns:
+            Combined score from 0-100
+        """
+        total_score = (
+            championship * self.WEIGHT_CHAMPIONSHIP
+            + form * self.WEIGHT_FORM
+            + team * self.WEIGHT_TEAM
+        )
+        total_weight = self._core_weight
+        
+        if qualifying is not None:
+            total_score += qualifying * self.WEIGHT_QUALIFYING
+            total_weight += self.WEIGHT_QUALIFYING
+        if circuit is not None:
+            total_score += circuit * self.WEIGHT_CIRCUIT
+            total_weight += self.WEIGHT_CIRCUIT
+        
+        return max(0.0, min(100.0, total_score / total_weight))
+    
+    @classmethod
+    def calculate_data_completeness(
+        cls,
+        driver_standings: Optional[List[DriverStanding]],
+        constructor_standings: Optional[List[ConstructorStanding]],
+        recent_results: Optional[List[RaceResult]],
+        qualifying_results: Optional[List[QualifyingResult]],
+        circuit_history: Optional[List[RaceResult]]
+    ) -> float:
+        """
+        Calculate data completeness factor.
+        
+        Each data source sets one bit when it returned data:
+        - Driver standings
+        - Constructor standings
+        - Recent (season) results
+        - Qualifying results
+        - Circuit history
+        
+        Args:
+            driver_standings: Driver standings if available
+            constructor_standings: Constructor standings if available
+            recent_results: Recent race results if available
+            qualifying_results: Qualifying results if available
+            circuit_history: Circuit history if available
+            
+        Returns:
+            Data completeness factor from 0.0 to 1.0
+        """
+        available = (
+            bool(driver_standings)
+            | bool(constructor_standings) << 1
+            | bool(recent_results) << 2
+            | bool(qualifying_results) << 3
+            | bool(circuit_history) << 4
+        )
+        return bin(available).count('1') / cls.DATA_SOURCE_COUNT
+    
     def calculate_confidence(
         self,
         combined_score: float,
@@ -402,7 +551,9 @@ class PredictionAnalyzer:
         driver_standing: Optional[DriverStanding] = None,
         qualifying_position: Optional[int] = None,
         recent_results: Optional[List[RaceResult]] = None,
-        circuit_history: Optional[List[RaceResult]] = None
+        circuit_history: Optional[List[RaceResult]] = None,
+        form_summary: Optional[ResultSummary] = None,
+        circuit_summary: Optional[ResultSummary] = None
     ) -> List[str]:
         """
         Generate human-readable reasoning for prediction.
@@ -418,6 +569,8 @@ class PredictionAnalyzer:
             qualifying_position: Qualifying position (optional)
             recent_results: Recent race results (optional)
             circuit_history: Circuit-specific history (optional)
+            form_summary: Precomputed summary of the driver's last N races (optional)
+            circuit_summary: Precomputed summary of the driver's circuit history (optional)
             
         Returns:
             List of reasoning strings
@@ -434,31 +587,32 @@ class PredictionAnalyzer:
         
         # Recent form
         if recent_results and 'form' in factors:
-            driver_results = [
-                r for r in recent_results
-                if r.driver.driver_id == driver.driver_id
-            ]
-            driver_results.sort(key=lambda r: r.race.date, reverse=True)
-            driver_results = driver_results[:self.RECENT_RACES_COUNT]
+            if form_summary is None:
+                driver_id = driver.driver_id
+                driver_results = [
+                    r for r in recent_results
+                    if r.driver_id == driver_id
+                ]
+                driver_results.sort(key=lambda r: r.race.date_ord, reverse=True)
+                form_summary = self.summarize_results(driver_results[:self.RECENT_RACES_COUNT])
             
-            if driver_results:
-                wins = sum(1 for r in driver_results if r.position == 1)
-                podiums = sum(1 for r in driver_results if r.position <= 3)
-                
-                if wins > 0:
+            if form_summary.races:
+                if form_summary.wins > 0:
                     reasoning.append(
-                        f"Recent Form: {wins} win(s) in last {len(driver_results)} races "
+                        f"Recent Form: {form_summary.wins} win(s) "
+                        f"in last {form_summary.races} races "
                         f"[Score: {factors['form']:.1f}]"
                     )
-                elif podiums > 0:
+                elif form_summary.podiums > 0:
                     reasoning.append(
-                        f"Recent Form: {podiums} podium(s) in last {len(driver_results)} races "
+                        f"Recent Form: {form_summary.podiums} podium(s) "
+                        f"in last {form_summary.races} races "
                         f"[Score: {factors['form']:.1f}]"
                     )
                 else:
-                    avg_position = sum(r.position for r in driver_results) / len(driver_results)
                     reasoning.append(
-                        f"Recent Form: Avg position {avg_position:.1f} in last {len(driver_results)} races "
+                        f"Recent Form: Avg position {form_summary.avg_position:.1f} "
+                        f"in last {form_summary.races} races "
                         f"[Score: {factors['form']:.1f}]"
                     )
         
@@ -479,32 +633,196 @@ class PredictionAnalyzer:
         
         # Circuit history
         if circuit_history and 'circuit' in factors:
-            driver_history = [
-                r for r in circuit_history
-                if r.driver.driver_id == driver.driver_id
-            ]
+            if circuit_summary is None:
+                driver_id = driver.driver_id
+                circuit_summary = self.summarize_results([
+                    r for r in circuit_history
+                    if r.driver_id == driver_id
+                ])
             
-            if driver_history:
-                wins = sum(1 for r in driver_history if r.position == 1)
-                podiums = sum(1 for r in driver_history if r.position <= 3)
-                
-                if wins > 0:
+            if circuit_summary.races:
+                if circuit_summary.wins > 0:
                     reasoning.append(
-                        f"Circuit History: {wins} win(s) at this circuit "
+                        f"Circuit History: {circuit_summary.wins} win(s) at this circuit "
                         f"[Score: {factors['circuit']:.1f}]"
                     )
-                elif podiums > 0:
+                elif circuit_summary.podiums > 0:
                     reasoning.append(
-                        f"Circuit History: {podiums} podium(s) at this circuit "
+                        f"Circuit History: {circuit_summary.podiums} podium(s) at this circuit "
                         f"[Score: {factors['circuit']:.1f}]"
                     )
                 else:
                     reasoning.append(
-                        f"Circuit History: {len(driver_history)} race(s) at this circuit "
+                        f"Circuit History: {circuit_summary.races} race(s) at this circuit "
                         f"[Score: {factors['circuit']:.1f}]"
                     )
         
         return reasoning
+    
+    @staticmethod
+    def build_reasoning_block(reasoning: List[str]) -> str:
+        """
+        Render reasoning strings as the bulleted block shown under each prediction.
+        
+        Args:
+            reasoning: Human-readable explanations
+            
+        Returns:
+            One "   • reason" line per explanation, newline-separated
+        """
+        return "\n".join(f"   • {reason}" for reason in reasoning)
+
+    @staticmethod
+    def summarize_results(results: List[RaceResult]) -> ResultSummary:
+        """
+        Summarize finishing positions for a list of a driver's results.
+        
+        Args:
+            results: Race results for a single driver
+            
+        Returns:
+            ResultSummary with race count, wins, podiums, points finishes
+            and average finishing position (0.0 if there are no results)
+        """
+        if not results:
+            return ResultSummary(0, 0, 0, 0, 0.0)
+        
+        # Single pass reading each position once
+        wins = podiums = points_finishes = total_position = 0
+        for result in results:
+            position = result.position
+            total_position += position
+            if position <= 10:
+                points_finishes += 1
+                if position <= 3:
+                    podiums += 1
+                    if position == 1:
+                        wins += 1
+        
+        races = len(results)
+        return ResultSummary(races, wins, podiums, points_finishes, total_position / races)
+    
+    @staticmethod
+    def _group_by_driver(results: List[RaceResult]) -> Dict[str, List[RaceResult]]:
+        """
+        Group race results by driver ID, preserving input order.
+        
+        Args:
+            results: Race results to group
+            
+        Returns:
+            Dictionary mapping driver ID to that driver's results
+        """
+        grouped: Dict[str, List[RaceResult]] = defaultdict(list)
+        for result in results:
+            grouped[result.driver_id].append(result)
+        return grouped
+    
+    def _calculate_standing_factors(
+        self,
+        driver: Driver,
+        constructor: Constructor,
+        driver_standings: List[DriverStanding],
+        qualifying_results: Optional[List[QualifyingResult]],
+        championship_context: StandingsContext,
+        team_scores: Dict[str, float],
+        qualifying_positions: Dict[str, int]
+    ) -> Tuple[float, float, Optional[float], Optional[int]]:
+        """
+        Calculate the lookup-based factor scores for a single driver.
+        
+        These factors need no result history, so analyze() computes them first
+        to bound each driver's confidence before scoring form and circuit.
+        
+        Args:
+            driver: Driver to score
+            constructor: Driver's constructor
+            driver_standings: Current driver championship standings
+            qualifying_results: Qualifying results for this race (optional)
+            championship_context: Precomputed driver standings context
+            team_scores: Team performance scores keyed by constructor ID
+            qualifying_positions: Qualifying positions keyed by driver ID
+            
+        Returns:
+            Tuple of (championship score, team score, qualifying score or None,
+            qualifying position or None)
+        """
+        # Missing standings and results are handled inside each scorer
+        # (neutral 50.0), so this path runs without per-factor guards;
+        # analyze() wraps the whole driver in a single try/except.
+        championship = self.calculate_championship_score(
+            driver, driver_standings, context=championship_context
+        )
+        # Teammates share a score; constructors missing from standings are neutral
+        team = team_scores.get(constructor.constructor_id, 50.0)
+        
+        qualifying = None
+        qualifying_position = None
+        if qualifying_results:
+            qualifying_position = qualifying_positions.get(driver.driver_id)
+            if qualifying_position is not None:
+                qualifying = self.calculate_qualifying_impact(qualifying_position)
+            else:
+                # Driver not in qualifying results, use neutral score
+                logger.debug("No qualifying data for %s", driver.surname)
+                qualifying = 50.0
+        
+        return championship, team, qualifying, qualifying_position
+    
+    def _calculate_factors(
+        self,
+        driver: Driver,
+        championship: float,
+        team: float,
+        qualifying: Optional[float],
+        recent_results: List[RaceResult],
+        circuit_history: Optional[List[RaceResult]],
+        recent_by_driver: Dict[str, List[RaceResult]],
+        circuit_by_driver: Dict[str, List[RaceResult]]
+    ) -> Tuple[Dict[str, float], ResultSummary, Optional[ResultSummary]]:
+        """
+        Calculate the history-based factor scores and assemble all factors.
+        
+        Args:
+            driver: Driver to score
+            championship: Championship score from _calculate_standing_factors()
+            team: Team score from _calculate_standing_factors()
+            qualifying: Qualifying score, or None if no qualifying data
+            recent_results: Recent race results for form calculation
+            circuit_history: Historical results at this circuit (optional)
+            recent_by_driver: Recent results grouped by driver ID, most recent first
+            circuit_by_driver: Circuit history grouped by driver ID
+            
+        Returns:
+            Tuple of (factor scores by name, recent form summary,
+            circuit history summary or None)
+        """
+        driver_id = driver.driver_id
+        
+        # Recent form score (always available)
+        driver_results = recent_by_driver.get(driver_id, [])[:self.RECENT_RACES_COUNT]
+        form_summary = self.summarize_results(driver_results)
+        
+        factors = {
+            'championship': championship,
+            'form': self.calculate_driver_form(
+                driver, recent_results, driver_results=driver_results
+            ),
+            'team': team
+        }
+        if qualifying is not None:
+            factors['qualifying'] = qualifying
+        
+        # Circuit advantage score (if available)
+        circuit_summary = None
+        if circuit_history:
+            circuit_summary = self.summarize_results(circuit_by_driver.get(driver_id, []))
+            if circuit_summary.races:
+                factors['circuit'] = self._score_circuit_summary(circuit_summary)
+            else:
+                factors['circuit'] = 50.0  # Neutral score if driver has no history at circuit
+        
+        return factors, form_summary, circuit_summary
 
     def analyze(
         self,
@@ -551,23 +869,48 @@ class PredictionAnalyzer:
             logger.warning("No recent results available, form calculations will use defaults")
             recent_results = []
         
-        predictions = []
         
         # Track data completeness
-        total_factors = 5
-        available_factors = 3  # Championship, form, and team are always available
-        if qualifying_results:
-            available_factors += 1
-        if circuit_history:
-            available_factors += 1
-        
-        data_completeness = available_factors / total_factors
+        data_completeness = self.calculate_data_completeness(
+            driver_standings, constructor_standings, recent_results,
+            qualifying_results, circuit_history
+        )
         
         logger.info(f"Analyzing race: {race.race_name}")
         logger.info(f"Data completeness: {data_completeness:.1%}")
         
-        # Generate predictions for each driver in standings
-        for driver_standing in driver_standings:
+        # Build lookup tables once so per-driver scoring avoids linear scans
+        # (setdefault keeps the first entry, matching the original search order)
+        championship_context = self.build_championship_context(driver_standings)
+        team_context = self.build_team_context(constructor_standings)
+        
+        # Score each constructor once; both of its drivers reuse the result
+        team_scores: Dict[str, float] = {
+            constructor_id: self.calculate_team_performance(
+                standing.constructor, constructor_standings, context=team_context
+            )
+            for constructor_id, standing in team_context.standings_by_id.items()
+        }
+        
+        qualifying_positions: Dict[str, int] = {}
+        for qual_result in qualifying_results or []:
+            if qual_result.driver_id:
+                qualifying_positions.setdefault(qual_result.driver_id, qual_result.position)
+        
+        # Group results by driver once instead of re-filtering per driver
+        recent_by_driver = self._group_by_driver(recent_results)
+        for driver_results in recent_by_driver.values():
+            driver_results.sort(key=lambda r: r.race.date_ord, reverse=True)
+        circuit_by_driver = self._group_by_driver(circuit_history or [])
+        
+        # Form and circuit scores are capped at 100, so each driver's confidence
+        # is bounded above by its standings-based factors plus maximal history
+        # scores (float ops are monotonic, so the bound is exact, not estimated)
+        max_circuit = 100.0 if circuit_history else None
+        
+        # (upper bound, standings index, standing, standings-based factor scores)
+        candidates = []
+        for index, driver_standing in enumerate(driver_standings):
             try:
                 driver = driver_standing.driver
                 constructor = driver_standing.constructor
@@ -581,125 +924,121 @@ class PredictionAnalyzer:
                     logger.warning(f"Invalid constructor data for {driver.surname}, skipping")
                     continue
                 
-                # Calculate individual factor scores
-                factors = {}
-                
-                # 1. Championship score (always available)
-                try:
-                    championship_score = self.calculate_championship_score(
-                        driver, driver_standings
-                    )
-                    factors['championship'] = championship_score
-                except Exception as e:
-                    logger.warning(f"Failed to calculate championship score for {driver.surname}: {e}")
-                    factors['championship'] = 50.0
-                
-                # 2. Recent form score (always available)
-                try:
-                    form_score = self.calculate_driver_form(driver, recent_results)
-                    factors['form'] = form_score
-                except Exception as e:
-                    logger.warning(f"Failed to calculate form score for {driver.surname}: {e}")
-                    factors['form'] = 50.0
-                
-                # 3. Team performance score (always available)
-                try:
-                    team_score = self.calculate_team_performance(
-                        constructor, constructor_standings
-                    )
-                    factors['team'] = team_score
-                except Exception as e:
-                    logger.warning(f"Failed to calculate team score for {constructor.name}: {e}")
-                    factors['team'] = 50.0
-                
-                # 4. Qualifying score (if available)
-                qualifying_position = None
-                if qualifying_results:
-                    # Find driver's qualifying position
-                    for qual_result in qualifying_results:
-                        if qual_result.driver.driver_id == driver.driver_id:
-                            qualifying_position = qual_result.position
-                            try:
-                                qualifying_score = self.calculate_qualifying_impact(
-                                    qualifying_position
-                                )
-                                factors['qualifying'] = qualifying_score
-                            except Exception as e:
-                                logger.warning(f"Failed to calculate qualifying score: {e}")
-                                factors['qualifying'] = 50.0
-                            break
-                    
-                    if qualifying_position is None:
-                        # Driver not in qualifying results, use neutral score
-                        logger.debug(f"No qualifying data for {driver.surname}")
-                        factors['qualifying'] = 50.0
-                
-                # 5. Circuit advantage score (if available)
-                if circuit_history:
-                    try:
-                        circuit_score = self.calculate_circuit_advantage(
-                            driver, race.circuit.circuit_id, circuit_history
-                        )
-                        factors['circuit'] = circuit_score
-                    except Exception as e:
-                        logger.warning(f"Failed to calculate circuit score: {e}")
-                        factors['circuit'] = 50.0
-                
-                # Combine factors into final score
-                try:
-                    combined_score = self.combine_factors(factors)
-                except Exception as e:
-                    logger.warning(f"Failed to combine factors for {driver.surname}: {e}")
-                    combined_score = 50.0
-                
-                # Calculate confidence adjusted for data completeness
-                try:
-                    confidence = self.calculate_confidence(combined_score, data_completeness)
-                except Exception as e:
-                    logger.warning(f"Failed to calculate confidence: {e}")
-                    confidence = combined_score * data_completeness
-                
-                # Generate reasoning
-                try:
-                    reasoning = self.generate_reasoning(
-                        driver=driver,
-                        constructor=constructor,
-                        factors=factors,
-                        driver_standing=driver_standing,
-                        qualifying_position=qualifying_position,
-                        recent_results=recent_results,
-                        circuit_history=circuit_history
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to generate reasoning: {e}")
-                    reasoning = [f"Confidence: {confidence:.1f}%"]
-                
-                # Create prediction
-                prediction = DriverPrediction(
+                standing_factors = self._calculate_standing_factors(
                     driver=driver,
                     constructor=constructor,
-                    confidence=confidence,
-                    factors=factors,
-                    reasoning=reasoning
+                    driver_standings=driver_standings,
+                    qualifying_results=qualifying_results,
+                    championship_context=championship_context,
+                    team_scores=team_scores,
+                    qualifying_positions=qualifying_positions
                 )
-                
-                predictions.append(prediction)
+                championship, team, qualifying, _ = standing_factors
+                upper_bound = self.calculate_confidence(
+                    self._combine_scores(championship, 100.0, team, qualifying, max_circuit),
+                    data_completeness
+                )
+                candidates.append((upper_bound, index, driver_standing, standing_factors))
                 
             except Exception as e:
                 logger.error(f"Failed to generate prediction for driver: {e}")
                 continue
         
-        # Sort by confidence (highest first)
-        predictions.sort(key=lambda p: p.confidence, reverse=True)
-        
-        # Return top N predictions
-        top_predictions = predictions[:top_n]
+        # Score drivers from the highest bound down and stop once no remaining
+        # driver can beat the current top N. The min-heap ranks entries by
+        # (confidence, -index) so ties keep standings order; each entry carries
+        # (confidence, standing, factors, qualifying position, form/circuit summaries)
+        candidates.sort(key=lambda entry: entry[0], reverse=True)
+        top_heap = []
+        scored_count = 0
+        for upper_bound, index, driver_standing, standing_factors in candidates:
+            if top_heap and len(top_heap) >= top_n and upper_bound < top_heap[0][0][0]:
+                break
+            
+            try:
+                championship, team, qualifying, qualifying_position = standing_factors
+                factors, form_summary, circuit_summary = self._calculate_factors(
+                    driver=driver_standing.driver,
+                    championship=championship,
+                    team=team,
+                    qualifying=qualifying,
+                    recent_results=recent_results,
+                    circuit_history=circuit_history,
+                    recent_by_driver=recent_by_driver,
+                    circuit_by_driver=circuit_by_driver
+                )
+                
+                # Combine factors and adjust for data completeness
+                combined_score = self._combine_scores(
+                    championship, factors['form'], team,
+                    qualifying, factors.get('circuit')
+                )
+                confidence = self.calculate_confidence(combined_score, data_completeness)
+                
+                scored_count += 1
+                rank = (confidence, -index)
+                entry = (
+                    confidence, driver_standing, factors,
+                    qualifying_position, form_summary, circuit_summary
+                )
+                if len(top_heap) < top_n:
+                    heapq.heappush(top_heap, (rank, entry))
+                elif top_heap and rank > top_heap[0][0]:
+                    heapq.heapreplace(top_heap, (rank, entry))
+                
+            except Exception as e:
+                logger.error(f"Failed to generate prediction for driver: {e}")
+                continue
         
-        logger.info(f"Generated {len(predictions)} predictions, returning top {top_n}")
-        for i, pred in enumerate(top_predictions, 1):
+        # Order the selected drivers by confidence (highest first)
+        top_heap.sort(reverse=True)
+        top_scored = [entry for _, entry in top_heap]
+        
+        # Build reasoning and predictions only for the selected drivers
+        top_predictions = []
+        for (
+            confidence, driver_standing, factors,
+            qualifying_position, form_summary, circuit_summary
+        ) in top_scored:
+            driver = driver_standing.driver
+            constructor = driver_standing.constructor
+            
+            # Generate reasoning
+            try:
+                reasoning = self.generate_reasoning(
+                    driver=driver,
+                    constructor=constructor,
+                    factors=factors,
+                    driver_standing=driver_standing,
+                    qualifying_position=qualifying_position,
+                    recent_results=recent_results,
+                    circuit_history=circuit_history,
+                    form_summary=form_summary,
+                    circuit_summary=circuit_summary
+                )
+            except Exception as e:
+                logger.warning(f"Failed to generate reasoning: {e}")
+                reasoning = [f"Confidence: {confidence:.1f}%"]
+            
+            # Create prediction
+            top_predictions.append(DriverPrediction(
+                driver=driver,
+                constructor=constructor,
+                confidence=confidence,
+                factors=factors,
+                reasoning=reasoning,
+                reasoning_block=self.build_reasoning_block(reasoning)
+            ))
+        
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"{i}. {pred.driver.surname} ({pred.constructor.name}): "
-                f"{pred.confidence:.1f}% confidence"
+                "Scored %d of %d candidate drivers, returning top %d",
+                scored_count, len(candidates), top_n
             )
+            for i, pred in enumerate(top_predictions, 1):
+                logger.info(
+                    "%d. %s (%s): %.1f%% confidence",
+                    i, pred.driver.surname, pred.constructor.name, pred.confidence
+                )
         
         return top_predictions
@@ -5,29 +5,67 @@ Provides local caching of API responses with TTL validation to minimize
 API calls and improve performance.
 """
 
-import json
+import atexit
+import mmap
 import os
-from datetime import datetime, timedelta
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Callable, Dict, List, NamedTuple
+
+
+class CacheEntry(NamedTuple):
+    """A cached value with its expiry and HTTP revalidation metadata."""
+    expires_at: float  # Unix timestamp
+    data: Any
+    validators: Optional[Dict[str, str]]  # e.g. {'etag': ..., 'last_modified': ...}
 
 
 class DataCache:
     """
     Local cache for F1 data with TTL support.
     
-    Stores data as JSON files with timestamp metadata for expiration validation.
+    Stores data as pickle files with timestamp metadata for expiration validation.
+    The cache is private to this package, so a compact binary format is used
+    instead of human-readable JSON. Recently used entries are also kept in
+    memory so repeated lookups within one run skip disk I/O, and writes are
+    buffered until flush() (called automatically at interpreter exit). The
+    number of files on disk is bounded by evicting the least recently used.
     """
     
-    def __init__(self, cache_dir: str = ".f1_cache"):
+    MEMORY_CACHE_SIZE = 128  # Maximum entries held in the in-memory layer
+    MMAP_MIN_SIZE = 4096  # Files at least this large are memory-mapped for loading
+    MAX_READ_WORKERS = 8  # Maximum threads used by get_many() and get_many_stale()
+    
+    # Characters in cache keys that are not valid in filenames
+    _KEY_TRANSLATION = str.maketrans({'/': '_', ':': '_'})
+    
+    def __init__(self, cache_dir: str = ".f1_cache", max_entries: int = 256):
         """
         Initialize cache with configurable directory.
         
         Args:
             cache_dir: Directory path for cache storage (default: .f1_cache)
+            max_entries: Maximum number of cache files kept on disk (default: 256)
         """
         self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        # In-memory LRU layer: key -> CacheEntry, most recently used last
+        self._mem: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # Write-behind buffer: key -> cache entry not yet written to disk
+        self._pending: Dict[str, dict] = {}
+        # Sanitized file path for each key seen so far
+        self._path_cache: Dict[str, Path] = {}
+        # Disk LRU order: cache file path -> key (None until the key is seen)
+        self._lru: "OrderedDict[Path, Optional[str]]" = OrderedDict()
+        # Guards the in-memory structures above; file I/O happens outside it
+        self._lock = threading.RLock()
         self._ensure_cache_dir()
+        self._load_lru_order()
+        atexit.register(self.flush)
     
     def _ensure_cache_dir(self) -> None:
         """Create cache directory if it doesn't exist."""
@@ -37,6 +75,49 @@ class DataCache:
             print(f"Warning: Failed to create cache directory '{self.cache_dir}': {e}")
             print("Caching will be disabled.")
     
+    def _load_lru_order(self) -> None:
+        """Seed the disk LRU order from existing cache files' access times."""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                files = [
+                    (entry.stat().st_atime, Path(entry.path))
+                    for entry in entries
+                    if entry.name.endswith('.pkl') and entry.is_file()
+                ]
+        except OSError:
+            return  # Missing or unreadable directory, start empty
+        
+        files.sort(key=lambda item: item[0])
+        for _, cache_path in files:
+            self._lru[cache_path] = None
+    
+    def _touch(self, key: str) -> Path:
+        """
+        Mark a key as most recently used in the disk LRU order.
+        
+        Args:
+            key: Cache key identifier
+            
+        Returns:
+            Path object for cache file
+        """
+        cache_path = self._get_cache_path(key)
+        self._lru[cache_path] = key
+        self._lru.move_to_end(cache_path)
+        return cache_path
+    
+    def _evict(self) -> None:
+        """Remove least recently used entries until within max_entries."""
+        while len(self._lru) > self.max_entries:
+            cache_path, key = self._lru.popitem(last=False)
+            if key is not None:
+                self._mem.pop(key, None)
+                self._pending.pop(key, None)
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError:
+                pass  # Not writable, nothing to reclaim
+    
     def _get_cache_path(self, key: str) -> Path:
         """
         Get file path for cache key.
@@ -47,79 +128,261 @@ class DataCache:
         Returns:
             Path object for cache file
         """
-        # Sanitize key to create valid filename
-        safe_key = key.replace('/', '_').replace(':', '_')
-        return self.cache_dir / f"{safe_key}.json"
+        cache_path = self._path_cache.get(key)
+        if cache_path is None:
+            # Sanitize key to create valid filename
+            safe_key = key.translate(self._KEY_TRANSLATION)
+            cache_path = self.cache_dir / f"{safe_key}.pkl"
+            self._path_cache[key] = cache_path
+        return cache_path
     
-    def get(self, key: str, ignore_ttl: bool = False) -> Optional[dict]:
+    def _load_file(self, cache_path: Path) -> Any:
         """
-        Retrieve cached data if valid.
+        Load a pickled cache entry from disk.
+        
+        Large files are memory-mapped and unpickled straight from the mapping,
+        avoiding a copy through a userspace read buffer.
         
         Args:
-            key: Cache key identifier
-            ignore_ttl: If True, return data even if expired (for fallback scenarios)
+            cache_path: Path of the cache file
             
         Returns:
-            Cached data dictionary if valid, None if not found or corrupted
+            Unpickled cache entry
         """
-        cache_path = self._get_cache_path(key)
+        with open(cache_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < self.MMAP_MIN_SIZE:
+                return pickle.load(f)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pickle.loads(mm)
+    
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """
+        Store an entry in the in-memory layer, evicting the least recently used.
         
-        if not cache_path.exists():
-            return None
+        Args:
+            key: Cache key identifier
+            entry: Cached entry
+        """
+        self._mem[key] = entry
+        self._mem.move_to_end(key)
+        if len(self._mem) > self.MEMORY_CACHE_SIZE:
+            self._mem.popitem(last=False)
+    
+    def _load_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Load an entry from memory, the write buffer or disk, ignoring expiry.
         
+        Args:
+            key: Cache key identifier
+            
+        Returns:
+            CacheEntry, or None if not found or corrupted
+        """
+        with self._lock:
+            mem_entry = self._mem.get(key)
+            if mem_entry is not None:
+                self._mem.move_to_end(key)
+                self._touch(key)
+                return mem_entry
+            
+            pending_entry = self._pending.get(key)
+            if pending_entry is not None:
+                entry = CacheEntry(
+                    pending_entry['expires_at'],
+                    pending_entry['data'],
+                    pending_entry.get('validators')
+                )
+                self._remember(key, entry)
+                self._touch(key)
+                return entry
+            
+            cache_path = self._get_cache_path(key)
+        
+        # Open directly rather than checking exists() first (one syscall fewer)
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_entry = json.load(f)
+            cache_entry = self._load_file(cache_path)
             
-            # Validate cache entry structure
-            if 'data' not in cache_entry or 'expires_at' not in cache_entry:
+            # Validate cache entry structure while reading its fields
+            try:
+                entry = CacheEntry(
+                    cache_entry['expires_at'],
+                    cache_entry['data'],
+                    cache_entry.get('validators')
+                )
+            except KeyError:
                 return None
             
-            # Check if cache is still valid (unless ignoring TTL)
-            if not ignore_ttl:
-                expires_at = datetime.fromisoformat(cache_entry['expires_at'])
-                if datetime.now() > expires_at:
-                    # Cache expired, but don't remove if we might need it as fallback
-                    return None
+            with self._lock:
+                self._remember(key, entry)
+                self._touch(key)
+            return entry
             
-            return cache_entry['data']
+        except FileNotFoundError:
+            return None
             
-        except (json.JSONDecodeError, ValueError, OSError) as e:
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError, OSError) as e:
             # Invalid cache file, log and remove it
             print(f"Warning: Corrupted cache file for key '{key}': {e}")
             try:
-                if cache_path.exists():
-                    cache_path.unlink()
+                cache_path.unlink(missing_ok=True)
             except OSError:
                 pass  # Ignore errors during cleanup
             return None
     
-    def set(self, key: str, data: Any, ttl: int = 3600) -> None:
+    def get(self, key: str) -> Optional[dict]:
         """
-        Store data in cache with expiration timestamp.
+        Retrieve cached data if valid.
         
         Args:
             key: Cache key identifier
-            data: Data to cache (must be JSON serializable)
-            ttl: Time to live in seconds (default: 3600 = 1 hour)
+            
+        Returns:
+            Cached data dictionary if valid, None if not found, expired or corrupted
         """
-        cache_path = self._get_cache_path(key)
+        entry = self._load_entry(key)
+        if entry is None or time.time() > entry.expires_at:
+            return None
+        return entry.data
+    
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """
+        Retrieve cached data with its expiry and validators, even if expired.
+        
+        Args:
+            key: Cache key identifier
+            
+        Returns:
+            CacheEntry, None if not found or corrupted
+        """
+        return self._load_entry(key)
+    
+    def get_stale(self, key: str) -> Optional[dict]:
+        """
+        Retrieve cached data even if expired (for fallback scenarios).
         
-        expires_at = datetime.now() + timedelta(seconds=ttl)
+        Expired entries are kept on disk so they can serve as a fallback when
+        fresh data cannot be fetched.
         
+        Args:
+            key: Cache key identifier
+            
+        Returns:
+            Cached data dictionary, None if not found or corrupted
+        """
+        entry = self._load_entry(key)
+        if entry is None:
+            return None
+        return entry.data
+    
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl: int = 3600,
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Store data in cache with expiration timestamp.
+        
+        The entry is available immediately but only written to disk by flush().
+        
+        Args:
+            key: Cache key identifier
+            data: Data to cache (must be picklable)
+            ttl: Time to live in seconds (default: 3600 = 1 hour)
+            validators: Optional HTTP validators ('etag', 'last_modified') used
+                to revalidate the entry once it expires
+        """
+        # Expiry is a Unix epoch float so lookups need a single comparison
         cache_entry = {
             'data': data,
-            'cached_at': datetime.now().isoformat(),
-            'expires_at': expires_at.isoformat(),
-            'ttl': ttl
+            'expires_at': time.time() + ttl,
+            'validators': validators
         }
         
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_entry, f, indent=2)
-        except (OSError, TypeError) as e:
-            # Log error but don't fail - caching is optional
-            print(f"Warning: Failed to write cache for key '{key}': {e}")
+        with self._lock:
+            self._remember(
+                key, CacheEntry(cache_entry['expires_at'], data, validators)
+            )
+            self._pending[key] = cache_entry
+            self._touch(key)
+            self._evict()
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Retrieve several cached entries, reading their files concurrently.
+        
+        Args:
+            keys: Cache key identifiers
+            
+        Returns:
+            Dictionary mapping each key to its cached data, or None if not valid
+        """
+        return self._read_many(keys, self.get)
+    
+    def get_many_stale(self, keys: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Retrieve several cached entries even if expired (for fallback scenarios).
+        
+        Args:
+            keys: Cache key identifiers
+            
+        Returns:
+            Dictionary mapping each key to its cached data, or None if not found
+            or corrupted
+        """
+        return self._read_many(keys, self.get_stale)
+    
+    def _read_many(
+        self,
+        keys: List[str],
+        getter: Callable[[str], Optional[dict]]
+    ) -> Dict[str, Optional[dict]]:
+        """
+        Look up several keys with getter, reading their files concurrently.
+        
+        Args:
+            keys: Cache key identifiers
+            getter: Single-key lookup, get() or get_stale()
+            
+        Returns:
+            Dictionary mapping each key to getter's result
+        """
+        if not keys:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_READ_WORKERS, len(keys))) as pool:
+            results = pool.map(getter, keys)
+            return dict(zip(keys, results))
+    
+    def flush(self) -> None:
+        """
+        Write all buffered cache entries to disk.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+            paths = {key: self._get_cache_path(key) for key in pending}
+        now = time.time()
+        
+        for key, cache_entry in pending.items():
+            cache_path = paths[key]
+            # Write to a sibling temp file and swap it in, so readers never
+            # see a partially written entry
+            tmp_path = cache_path.with_suffix('.pkl.tmp')
+            try:
+                with open(tmp_path, 'wb') as f:
+                    pickle.dump(cache_entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                # Stamp the expiry as the file's mtime so is_valid() needs only a stat
+                os.utime(tmp_path, (now, cache_entry['expires_at']))
+                os.replace(tmp_path, cache_path)
+            except (OSError, TypeError, pickle.PicklingError) as e:
+                # Log error but don't fail - caching is optional
+                print(f"Warning: Failed to write cache for key '{key}': {e}")
+                try:
+                    tmp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass  # Ignore errors during cleanup
     
     def is_valid(self, key: str) -> bool:
         """
@@ -131,33 +394,41 @@ class DataCache:
         Returns:
             True if cache exists and hasn't expired, False otherwise
         """
-        cache_path = self._get_cache_path(key)
-        
-        if not cache_path.exists():
-            return False
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_entry = json.load(f)
-            
-            if 'expires_at' not in cache_entry:
-                return False
+        with self._lock:
+            mem_entry = self._mem.get(key)
+            if mem_entry is not None:
+                return time.time() <= mem_entry.expires_at
             
-            expires_at = datetime.fromisoformat(cache_entry['expires_at'])
-            return datetime.now() <= expires_at
+            pending_entry = self._pending.get(key)
+            if pending_entry is not None:
+                return time.time() <= pending_entry['expires_at']
             
-        except (json.JSONDecodeError, ValueError, OSError):
+            cache_path = self._get_cache_path(key)
+        
+        # flush() stamps each file's mtime with its expiry time
+        try:
+            return time.time() <= os.stat(cache_path).st_mtime
+        except OSError:
             return False
     
     def clear(self) -> None:
         """
-        Clear all cached data by removing all cache files.
-        """
-        if not self.cache_dir.exists():
-            return
+        Clear all cached data by removing this cache's files.
         
-        try:
-            for cache_file in self.cache_dir.glob('*.json'):
-                cache_file.unlink()
-        except OSError as e:
-            print(f"Warning: Failed to clear cache: {e}")
+        Only cache files ('*.pkl' and leftover '*.pkl.tmp' writes) are
+        removed; the directory and any other files in it are left alone.
+        """
+        with self._lock:
+            self._mem.clear()
+            self._pending.clear()
+            self._lru.clear()
+            
+            try:
+                with os.scandir(self.cache_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(('.pkl', '.pkl.tmp')) and entry.is_file():
+                            os.unlink(entry.path)
+            except FileNotFoundError:
+                return  # Nothing cached yet
+            except OSError as e:
+                print(f"Warning: Failed to clear cache: {e}")
@@ -1,19 +1,19 @@
 """Command-line interface for F1 Race Predictor."""
 
 import argparse
+import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
-from f1_predictor.engine import PredictionEngine
-from f1_predictor.models import PredictionError
 
-
-def parse_arguments() -> argparse.Namespace:
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser (constructed once and reused).
     
     Returns:
-        Parsed arguments namespace
+        Configured ArgumentParser
     """
     parser = argparse.ArgumentParser(
         prog='f1-predictor',
@@ -68,6 +68,11 @@ Examples:
         action='store_true',
         help='Disable caching and fetch fresh data from API'
     )
+    parser.add_argument(
+        '--force-full-fetch',
+        action='store_true',
+        help='Fetch qualifying results even when the race is more than 3 days away'
+    )
     
     # ML options
     parser.add_argument(
@@ -76,6 +81,17 @@ Examples:
         help='Use machine learning model instead of statistical analysis'
     )
     
+    return parser
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = _build_parser()
     args = parser.parse_args()
     
     # Validate arguments
@@ -98,19 +114,32 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    # Parse command-line arguments
+    args = parse_arguments()
+    
+    # The application, not the library modules, owns logging configuration
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Imported only after parsing so --help and usage errors skip loading the
+    # prediction stack
+    from f1_predictor.engine import PredictionEngine
+    from f1_predictor.models import PredictionError
+    
     engine = None
+    completed = False
     
     try:
-        # Parse command-line arguments
-        args = parse_arguments()
-        
         # Initialize prediction engine with configuration
         use_cache = not args.no_cache
         engine = PredictionEngine(
             use_cache=use_cache,
             top_n=args.top,
             verbose=args.verbose,
-            use_ml=args.ml
+            use_ml=args.ml,
+            force_full_fetch=args.force_full_fetch
         )
         
         # Show initial message
@@ -125,6 +154,7 @@ def main() -> int:
         formatted_output = engine.format_result(result)
         print(formatted_output)
         
+        completed = True
         return 0
         
     except PredictionError as e:
@@ -149,6 +179,12 @@ def main() -> int:
         print("Please report this issue if it persists.", file=sys.stderr)
         print("=" * 65, file=sys.stderr)
         return 1
+        
+    finally:
+        # Stop worker threads and persist any responses fetched during this run;
+        # after an error or Ctrl-C, don't block on fetches nobody will read
+        if engine:
+            engine.close(wait=completed)
 
 
 if __name__ == '__main__':
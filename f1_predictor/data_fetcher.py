@@ -10,21 +10,209 @@ maintaining the same API structure and endpoints for backward compatibility.
 
 import time
 import logging
+import random
+import threading
+from collections import deque
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Optional: faster decoding of large result payloads
+except ImportError:
+    orjson = None
 
 from f1_predictor.models import (
     Race, Circuit, Driver, Constructor, RaceResult,
     QualifyingResult, DriverStanding, ConstructorStanding
 )
-from f1_predictor.cache import DataCache
+from f1_predictor.cache import CacheEntry, DataCache
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library module: no handler configuration here, the application owns that
 logger = logging.getLogger(__name__)
 
+# Returned by _make_request when the server answers 304 Not Modified
+_NOT_MODIFIED = object()
+
+
+class _NoDataError(requests.HTTPError):
+    """The API has no resource at the requested URL (HTTP 404); not retried."""
+
+
+# Required fields for each API object, checked with one set difference per parse
+_CIRCUIT_REQUIRED = frozenset({'circuitId', 'circuitName', 'Location'})
+_DRIVER_REQUIRED = frozenset({'driverId', 'givenName', 'familyName', 'nationality'})
+_CONSTRUCTOR_REQUIRED = frozenset({'constructorId', 'name', 'nationality'})
+_RACE_REQUIRED = frozenset({'season', 'round', 'raceName', 'Circuit', 'date'})
+_RACE_RESULT_REQUIRED = frozenset(
+    {'Driver', 'Constructor', 'position', 'points', 'grid', 'laps', 'status'}
+)
+_QUALIFYING_RESULT_REQUIRED = frozenset({'Driver', 'Constructor', 'position'})
+_DRIVER_STANDING_REQUIRED = frozenset({'Driver', 'Constructors', 'position', 'points', 'wins'})
+_CONSTRUCTOR_STANDING_REQUIRED = frozenset({'Constructor', 'position', 'points', 'wins'})
+
+
+def _parse_race_datetime(date_str: str, time_str: str) -> datetime:
+    """
+    Parse an API race date and time into a naive datetime.
+    
+    The API's usual 'YYYY-MM-DD' / 'HH:MM:SS[Z]' shape is sliced directly;
+    anything else goes through datetime.fromisoformat().
+    
+    Args:
+        date_str: Date as 'YYYY-MM-DD'
+        time_str: Time as 'HH:MM:SS', optionally with a trailing 'Z'
+        
+    Returns:
+        Naive datetime (UTC wall time)
+        
+    Raises:
+        ValueError: If the date or time is malformed
+    """
+    if (
+        len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+        and (len(time_str) == 8 or (len(time_str) == 9 and time_str[8] == 'Z'))
+        and time_str[2] == ':' and time_str[5] == ':'
+    ):
+        return datetime(
+            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+            int(time_str[0:2]), int(time_str[3:5]), int(time_str[6:8])
+        )
+    return datetime.fromisoformat(f"{date_str}T{time_str.rstrip('Z')}")
+
+
+def _slim_race_results(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop race result fields that are never parsed (e.g. 'Time', 'FastestLap').
+    
+    Results payloads are cached and kept in memory, and most of each row is
+    timing detail that _parse_race_result ignores. Rows keep only the fields
+    in _RACE_RESULT_REQUIRED (nested driver and constructor objects are kept whole).
+    
+    Args:
+        data: Decoded API response with a 'RaceTable' of races with 'Results'
+        
+    Returns:
+        The same response, with each race's results trimmed in place
+    """
+    races = data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
+    for race_data in races:
+        results = race_data.get('Results') if isinstance(race_data, dict) else None
+        if not results:
+            continue
+        race_data['Results'] = [
+            {key: row[key] for key in _RACE_RESULT_REQUIRED if key in row}
+            if isinstance(row, dict) else row
+            for row in results
+        ]
+    return data
+
+
+def _is_complete_season(data: Dict[str, Any]) -> bool:
+    """
+    Check that a merged season results response holds every result row.
+    
+    Args:
+        data: Response built by F1DataFetcher._get_season_results_data
+        
+    Returns:
+        True if the number of 'Results' rows equals 'MRData.total'
+    """
+    try:
+        races = data['MRData']['RaceTable']['Races']
+        rows = sum(len(race_data.get('Results', [])) for race_data in races)
+        return rows == int(data['MRData']['total'])
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return False
+
+
+class _InflightFetch:
+    """
+    A fetch of one cache key in progress, shared with concurrent callers.
+    
+    The thread running the fetch records its outcome (data or exception)
+    before setting 'done', so waiters reuse it instead of fetching again.
+    """
+    
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.data: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+    
+    def wait(self) -> Dict[str, Any]:
+        """
+        Wait for the fetch to finish and return its outcome.
+        
+        Returns:
+            The data the fetch returned
+            
+        Raises:
+            requests.RequestException: If the shared fetch failed (the
+                exception it raised is re-raised)
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.data
+
+
+class _ConcurrencyLimiter:
+    """
+    Caps in-flight API requests with an AIMD (additive increase,
+    multiplicative decrease) controller.
+    
+    The limit grows slowly while responses arrive under the target latency
+    and halves when a response is slow or the server signals congestion
+    (429, 5xx, timeout). Like TCP, it halves at most once per window: the
+    requests already in flight when the limit drops report on the old limit,
+    so their slow responses do not halve it again.
+    """
+    
+    INITIAL_LIMIT = 4
+    MIN_LIMIT = 1
+    MAX_LIMIT = 32
+    # Well above Jolpica's usual response time, so only real slowdowns count
+    TARGET_LATENCY = 2.0  # seconds
+    
+    def __init__(self):
+        """Initialize the limiter at its starting concurrency."""
+        self.limit = float(self.INITIAL_LIMIT)
+        self._in_flight = 0
+        # Responses still due from requests sent before the last decrease
+        self._pending_since_decrease = 0
+        self._condition = threading.Condition()
+    
+    def acquire(self) -> None:
+        """Block until a request slot is available under the current limit."""
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+    
+    def release(self, latency: float, congested: bool) -> None:
+        """
+        Free a request slot and adapt the limit to the observed outcome.
+        
+        Args:
+            latency: Request duration in seconds
+            congested: Whether the server signalled overload
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if self._pending_since_decrease > 0:
+                # Sent under the previous limit; already accounted for
+                self._pending_since_decrease -= 1
+            elif congested or latency > self.TARGET_LATENCY:
+                self.limit = max(self.MIN_LIMIT, self.limit * 0.5)
+                self._pending_since_decrease = self._in_flight
+            else:
+                self.limit = min(self.MAX_LIMIT, self.limit + 0.5)
+            self._condition.notify_all()
+
 
 class F1DataFetcher:
     """
@@ -32,107 +220,364 @@ class F1DataFetcher:
     
     Includes error handling, retry logic, rate limiting, and caching support.
     Jolpica maintains Ergast API compatibility while providing updated data.
+    Getters are safe to call from multiple threads, so independent endpoints
+    can be fetched concurrently. Prefer the shared instance from get_fetcher()
+    so connections, cache and rate-limit state are reused process-wide.
     """
     
     BASE_URL = "https://api.jolpi.ca/ergast/f1"
     REQUEST_TIMEOUT = 10  # seconds
-    RATE_LIMIT_DELAY = 0.1  # 100ms between requests
+    # Sliding-window limits as (window seconds, max requests): Jolpica allows
+    # bursts of 4 requests per second and 500 requests per hour
+    RATE_LIMITS = ((1.0, 4), (3600.0, 500))
+    LOW_QUOTA_RATIO = 0.1  # Pause when less than 10% of the server quota remains
+    LOW_QUOTA_PAUSE = 1.0  # Pause in seconds when the server gives no reset time
     MAX_RETRIES = 3
+    BACKOFF_BASE = 0.5  # seconds, scaled by 2**attempt before jitter
+    BACKOFF_CAP = 30.0  # Maximum backoff in seconds
+    RETRY_AFTER_JITTER = 0.5  # Extra random delay added to a server Retry-After
+    POOL_CONNECTIONS = 4  # Connection pools kept per host
+    POOL_MAXSIZE = 16  # Connections kept alive per pool
+    HISTORY_WORKERS = 6  # Threads fetching circuit history seasons concurrently
     
     # Cache TTL values (in seconds)
     CACHE_TTL_SEASON_RESULTS = 86400  # 24 hours
     CACHE_TTL_STANDINGS = 21600  # 6 hours
     CACHE_TTL_QUALIFYING = 3600  # 1 hour
-    CACHE_TTL_CIRCUIT_HISTORY = 604800  # 7 days
     CACHE_TTL_NEXT_RACE = 3600  # 1 hour
+    CACHE_TTL_PAST_SEASON = 31536000  # 1 year: finished seasons no longer change
+    PAGE_SIZE = 100  # Jolpica caps 'limit' at 100 rows per request
     
-    def __init__(self, cache: Optional[DataCache] = None, use_cache: bool = True):
+    def __init__(
+        self,
+        cache: Optional[DataCache] = None,
+        use_cache: bool = True,
+        stale_while_revalidate: bool = False
+    ):
         """
         Initialize F1 data fetcher.
         
         Args:
             cache: DataCache instance for caching (creates default if None)
             use_cache: Whether to use caching (default: True)
+            stale_while_revalidate: Return recently expired cache entries
+                immediately and refresh them in the background (default: False)
         """
         self.cache = cache if cache else DataCache()
         self.use_cache = use_cache
-        self._last_request_time = 0.0
+        self.stale_while_revalidate = stale_while_revalidate
+        # Cache keys being fetched, in the foreground or by a background refresh
+        self._inflight: Dict[str, _InflightFetch] = {}
+        self._inflight_lock = threading.Lock()
+        # Request start times per RATE_LIMITS window (may include reserved future slots)
+        self._request_times = tuple(deque() for _ in self.RATE_LIMITS)
+        self._pause_until = 0.0  # Set from rate-limit response headers
+        self._rate_lock = threading.Lock()
+        self._concurrency = _ConcurrencyLimiter()
+        
+        # Parsed entities keyed by API ID; a season has only ~20 drivers and
+        # ~10 constructors, so result rows share instances instead of copies
+        self._driver_cache: Dict[str, Driver] = {}
+        self._constructor_cache: Dict[str, Constructor] = {}
+        self._circuit_cache: Dict[str, Circuit] = {}
+        
+        # Season -> round -> qualifying results, filled by get_season_qualifying_results()
+        self._season_qualifying: Dict[int, Dict[int, List[QualifyingResult]]] = {}
+        
+        # Reuse TCP/TLS connections across requests; retries are handled in
+        # _make_request, so the adapter itself never retries
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=0
+            )
+        )
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "F1DataFetcher":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _rate_limit(self) -> None:
-        """Implement rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        """
+        Wait until a request is allowed by every sliding window.
+        
+        Requests proceed immediately while quota remains, so bursts are not
+        delayed. Slots are reserved under a lock and the wait happens outside
+        it, so concurrent callers queue in order.
+        """
+        with self._rate_lock:
+            now = time.time()
+            slot = max(now, self._pause_until)
+            for (window, limit), times in zip(self.RATE_LIMITS, self._request_times):
+                while times and times[0] <= now - window:
+                    times.popleft()
+                if len(times) >= limit:
+                    # The limit-th most recent request must leave the window first
+                    slot = max(slot, times[-limit] + window)
+            for times in self._request_times:
+                times.append(slot)
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        """
+        Back off proactively when the server reports little remaining quota.
+        
+        Args:
+            response: HTTP response carrying optional x-ratelimit-* headers
+        """
+        headers = response.headers
+        try:
+            remaining = int(headers['x-ratelimit-remaining'])
+            limit = int(headers['x-ratelimit-limit'])
+        except (KeyError, ValueError):
+            return  # Server did not report its quota
+        
+        if limit <= 0 or remaining >= limit * self.LOW_QUOTA_RATIO:
+            return
+        
+        try:
+            pause = float(headers.get('x-ratelimit-reset', self.LOW_QUOTA_PAUSE))
+        except ValueError:
+            pause = self.LOW_QUOTA_PAUSE
+        if pause > 1e9:
+            pause -= time.time()  # Reset given as a Unix timestamp, not a delay
+        pause = max(0.0, pause)
+        logger.warning(f"API quota low ({remaining}/{limit} remaining), pausing {pause:.1f}s")
+        with self._rate_lock:
+            self._pause_until = max(self._pause_until, time.time() + pause)
+    
+    def _backoff_delay(self, retry_count: int) -> float:
+        """
+        Compute a "full jitter" exponential backoff delay.
+        
+        Random delays keep clients that failed together from retrying in lockstep.
+        
+        Args:
+            retry_count: Number of attempts made so far
+            
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2 ** retry_count))
+    
+    def _retry_after_delay(
+        self,
+        response: requests.Response,
+        retry_count: int
+    ) -> Optional[float]:
+        """
+        Get the delay requested by a throttling response.
+        
+        Args:
+            response: HTTP 429 response
+            retry_count: Number of attempts made so far
+            
+        Returns:
+            Retry-After seconds plus a small jitter (at most BACKOFF_CAP), a
+            backoff delay if the header is missing or not a number of seconds,
+            or None if the server asks to wait longer than BACKOFF_CAP
+        """
+        try:
+            retry_after = float(response.headers['Retry-After'])
+        except (KeyError, ValueError):
+            return self._backoff_delay(retry_count)
+        if retry_after > self.BACKOFF_CAP:
+            return None  # e.g. an exhausted hourly quota: not worth waiting for
+        return min(
+            self.BACKOFF_CAP,
+            max(0.0, retry_after) + random.uniform(0, self.RETRY_AFTER_JITTER)
+        )
+    
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        Send one GET request within the adaptive concurrency limit.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            headers: Extra request headers
+            
+        Returns:
+            HTTP response (status not yet checked)
+        """
+        self._concurrency.acquire()
+        start = time.monotonic()
+        congested = True  # Timeouts and connection errors count as congestion
+        try:
+            response = self._session.get(
+                url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT
+            )
+            congested = response.status_code == 429 or response.status_code >= 500
+            return response
+        finally:
+            self._concurrency.release(time.monotonic() - start, congested)
+    
+    @staticmethod
+    def _conditional_headers(
+        validators: Optional[Dict[str, str]]
+    ) -> Optional[Dict[str, str]]:
+        """
+        Build conditional GET headers from a cached entry's validators.
+        
+        Args:
+            validators: Stored 'etag' and/or 'last_modified' values
+            
+        Returns:
+            Request headers, or None if there is nothing to revalidate with
+        """
+        if not validators:
+            return None
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers or None
     
-    def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _response_validators(response: requests.Response) -> Optional[Dict[str, str]]:
+        """
+        Extract the ETag and Last-Modified validators from a response.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Dictionary of validators, or None if the response has neither
+        """
+        validators = {}
+        etag = response.headers.get('ETag')
+        if etag:
+            validators['etag'] = etag
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            validators['last_modified'] = last_modified
+        return validators or None
+    
+    def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Any, Optional[Dict[str, str]]]:
         """
         Make HTTP request with retry logic and error handling.
         
+        When validators from a previous response are given, the request is
+        conditional and an unchanged resource costs a bodiless 304 response.
+        
         Args:
             url: API endpoint URL
             params: Query parameters
+            validators: Cached 'etag'/'last_modified' values to revalidate with
             
         Returns:
-            JSON response as dictionary
+            Tuple of (JSON response as dictionary, or _NOT_MODIFIED if the
+            cached copy is still current; the response's validators)
             
         Raises:
+            _NoDataError: If the API returns 404 for the URL
             requests.RequestException: If request fails after retries
         """
         self._rate_limit()
+        headers = self._conditional_headers(validators)
         
         retry_count = 0
         last_exception = None
         
         while retry_count < self.MAX_RETRIES:
             try:
-                response = requests.get(
-                    url,
-                    params=params,
-                    timeout=self.REQUEST_TIMEOUT
-                )
-                response.raise_for_status()
-                
+                response = self._send(url, params, headers)
+            except requests.Timeout as e:
+                last_exception = e
+                retry_count += 1
+                logger.warning(f"Request timeout (attempt {retry_count}/{self.MAX_RETRIES}): {url}")
+                if retry_count < self.MAX_RETRIES:
+                    # Exponential backoff with jitter
+                    time.sleep(self._backoff_delay(retry_count))
+                continue
+            except requests.RequestException as e:
+                last_exception = e
+                retry_count += 1
+                logger.warning(f"Request failed (attempt {retry_count}/{self.MAX_RETRIES}): {url} - {e}")
+                if retry_count < self.MAX_RETRIES:
+                    # Exponential backoff with jitter
+                    time.sleep(self._backoff_delay(retry_count))
+                continue
+            
+            self._update_rate_limit(response)
+            
+            # Dispatch on the status code directly rather than through
+            # raise_for_status(), so expected outcomes don't build exceptions
+            status = response.status_code
+            if 200 <= status < 300:
                 # Validate JSON response
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content) if orjson else response.json()
                     # Validate basic structure
                     if not isinstance(data, dict):
                         raise ValueError("API response is not a valid JSON object")
                     if 'MRData' not in data:
                         raise ValueError("API response missing 'MRData' field")
-                    return data
+                    return data, self._response_validators(response)
                 except ValueError as e:
                     logger.error(f"Invalid JSON response from API: {e}")
-                    raise requests.RequestException(f"Invalid API response format: {e}")
-                
-            except requests.Timeout as e:
-                last_exception = e
-                retry_count += 1
-                logger.warning(f"Request timeout (attempt {retry_count}/{self.MAX_RETRIES}): {url}")
-                if retry_count < self.MAX_RETRIES:
-                    # Exponential backoff
-                    time.sleep(2 ** retry_count)
-                    
-            except requests.HTTPError as e:
-                # Don't retry on client errors (4xx)
-                if 400 <= e.response.status_code < 500:
-                    logger.error(f"Client error {e.response.status_code}: {url}")
-                    raise
-                # Retry on server errors (5xx)
-                last_exception = e
-                retry_count += 1
-                logger.warning(f"Server error (attempt {retry_count}/{self.MAX_RETRIES}): {url} - {e}")
-                if retry_count < self.MAX_RETRIES:
-                    time.sleep(2 ** retry_count)
-                    
-            except requests.RequestException as e:
-                last_exception = e
+                    last_exception = requests.RequestException(f"Invalid API response format: {e}")
+                    retry_count += 1
+                    if retry_count < self.MAX_RETRIES:
+                        time.sleep(self._backoff_delay(retry_count))
+                    continue
+            
+            if status == 304 and headers:
+                return _NOT_MODIFIED, self._response_validators(response) or validators
+            
+            if status == 404:
+                # Nothing published at this URL (yet), e.g. a future race
+                raise _NoDataError(f"No data available: {url}", response=response)
+            
+            if status == 429:
+                # Retry when throttled, honoring the server's Retry-After
+                last_exception = requests.HTTPError(
+                    f"429 Too Many Requests: {url}", response=response
+                )
                 retry_count += 1
-                logger.warning(f"Request failed (attempt {retry_count}/{self.MAX_RETRIES}): {url} - {e}")
+                logger.warning(f"Rate limited (attempt {retry_count}/{self.MAX_RETRIES}): {url}")
                 if retry_count < self.MAX_RETRIES:
-                    # Exponential backoff
-                    time.sleep(2 ** retry_count)
+                    delay = self._retry_after_delay(response, retry_count)
+                    if delay is None:
+                        # Fail fast so callers can fall back to stale cache
+                        raise last_exception
+                    time.sleep(delay)
+                continue
+            
+            if status < 500:
+                # Don't retry on other client errors (4xx)
+                logger.error(f"Client error {status}: {url}")
+                raise requests.HTTPError(f"{status} Client Error: {url}", response=response)
+            
+            # Retry on server errors (5xx)
+            last_exception = requests.HTTPError(f"{status} Server Error: {url}", response=response)
+            retry_count += 1
+            logger.warning(
+                f"Server error (attempt {retry_count}/{self.MAX_RETRIES}): {url} - {status}"
+            )
+            if retry_count < self.MAX_RETRIES:
+                time.sleep(self._backoff_delay(retry_count))
         
         # All retries failed
         logger.error(f"Request failed after {self.MAX_RETRIES} attempts: {url}")
@@ -143,7 +588,8 @@ class F1DataFetcher:
         cache_key: str,
         url: str,
         ttl: int,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Get data from cache or fetch from API.
@@ -153,6 +599,8 @@ class F1DataFetcher:
             url: API endpoint URL
             ttl: Cache TTL in seconds
             params: Query parameters
+            transform: Applied to freshly fetched data before it is cached,
+                e.g. to drop fields the caller never reads
             
         Returns:
             JSON response as dictionary
@@ -161,37 +609,139 @@ class F1DataFetcher:
             requests.RequestException: If API request fails and no cache available
         """
         # Check cache first if enabled
+        cached_entry = None
         if self.use_cache:
             try:
-                cached_data = self.cache.get(cache_key)
-                if cached_data is not None:
-                    logger.info(f"Cache hit: {cache_key}")
-                    return cached_data
+                cached_entry = self.cache.get_entry(cache_key)
+                if cached_entry is not None:
+                    now = time.time()
+                    if now <= cached_entry.expires_at:
+                        logger.debug("Cache hit: %s", cache_key)
+                        return cached_entry.data
+                    # Serve entries expired by less than one TTL while refreshing
+                    if self.stale_while_revalidate and now <= cached_entry.expires_at + ttl:
+                        logger.debug("Serving stale cache, refreshing: %s", cache_key)
+                        self._refresh_in_background(cache_key, url, ttl, params, transform)
+                        return cached_entry.data
             except Exception as e:
                 logger.warning(f"Cache read error for {cache_key}: {e}")
+                cached_entry = None
                 # Continue to fetch from API
         
-        # Fetch from API
-        logger.info(f"Fetching from API: {url}")
+        if not self.use_cache:
+            return self._fetch_and_cache(cache_key, url, ttl, params, transform, None)
+        
+        # Let one thread fetch each key; concurrent callers wait and share its
+        # outcome, data or exception, instead of sending their own requests
+        with self._inflight_lock:
+            inflight = self._inflight.get(cache_key)
+            leader = inflight is None
+            if leader:
+                inflight = self._inflight[cache_key] = _InflightFetch()
+        if not leader:
+            return inflight.wait()
+        
+        return self._lead_fetch(inflight, cache_key, url, ttl, params, transform, cached_entry)
+    
+    def _lead_fetch(
+        self,
+        inflight: _InflightFetch,
+        cache_key: str,
+        url: str,
+        ttl: int,
+        params: Optional[Dict[str, Any]],
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]],
+        cached_entry: Optional[CacheEntry]
+    ) -> Dict[str, Any]:
+        """
+        Run a registered in-flight fetch and publish its outcome to waiters.
+        
+        Args:
+            inflight: Record registered in _inflight for cache_key
+            cache_key: Cache key identifier
+            url: API endpoint URL
+            ttl: Cache TTL in seconds
+            params: Query parameters
+            transform: Applied to freshly fetched data before it is cached
+            cached_entry: Expired cache entry to revalidate, if any
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            requests.RequestException: If API request fails and no cache available
+        """
+        try:
+            inflight.data = self._fetch_and_cache(
+                cache_key, url, ttl, params, transform, cached_entry
+            )
+            return inflight.data
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key)
+            inflight.done.set()
+    
+    def _fetch_and_cache(
+        self,
+        cache_key: str,
+        url: str,
+        ttl: int,
+        params: Optional[Dict[str, Any]],
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]],
+        cached_entry: Optional[CacheEntry]
+    ) -> Dict[str, Any]:
+        """
+        Fetch data from the API and cache it, falling back to stale cache.
+        
+        Args:
+            cache_key: Cache key identifier
+            url: API endpoint URL
+            ttl: Cache TTL in seconds
+            params: Query parameters
+            transform: Applied to freshly fetched data before it is cached
+            cached_entry: Expired cache entry to revalidate, if any
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            requests.RequestException: If API request fails and no cache available
+        """
+        # Fetch from API, revalidating the expired entry if there is one
+        logger.info("Fetching from API: %s", url)
         try:
-            data = self._make_request(url, params)
+            data, validators = self._make_request(
+                url, params, cached_entry.validators if cached_entry else None
+            )
+            if data is _NOT_MODIFIED:
+                logger.debug("Not modified, extending cache: %s", cache_key)
+                data = cached_entry.data
+            elif transform is not None:
+                data = transform(data)
             
             # Store in cache if enabled
             if self.use_cache:
                 try:
-                    self.cache.set(cache_key, data, ttl)
+                    self.cache.set(cache_key, data, ttl, validators)
                 except Exception as e:
                     logger.warning(f"Cache write error for {cache_key}: {e}")
                     # Continue without caching
             
             return data
             
+        except _NoDataError:
+            # Expected for data not published yet; callers treat it as empty
+            logger.debug("No data at %s", url)
+            raise
         except requests.RequestException as e:
             # If API fails, try to use stale cache as fallback
             if self.use_cache:
                 logger.warning("API request failed, attempting to use stale cache...")
                 try:
-                    stale_data = self.cache.get(cache_key, ignore_ttl=True)
+                    stale_data = self.cache.get_stale(cache_key)
                     if stale_data is not None:
                         logger.info(f"Using stale cache data for {cache_key}")
                         return stale_data
@@ -202,6 +752,87 @@ class F1DataFetcher:
             logger.error(f"No fallback data available for {cache_key}")
             raise
 
+    def _refresh_in_background(
+        self,
+        cache_key: str,
+        url: str,
+        ttl: int,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Start a background refresh of a cache entry unless it is being fetched.
+        
+        The refresh is registered in _inflight like a foreground fetch, so the
+        two never request the same key at once.
+        
+        The thread is not a daemon, so a refresh started near exit still
+        completes and is flushed to disk.
+        
+        Args:
+            cache_key: Cache key identifier
+            url: API endpoint URL
+            ttl: Cache TTL in seconds
+            params: Query parameters
+            transform: Applied to the fetched data before it is cached
+        """
+        with self._inflight_lock:
+            if cache_key in self._inflight:
+                return
+            inflight = self._inflight[cache_key] = _InflightFetch()
+        
+        threading.Thread(
+            target=self._refresh,
+            args=(inflight, cache_key, url, ttl, params, transform),
+            name=f"refresh-{cache_key}"
+        ).start()
+    
+    def _refresh(
+        self,
+        inflight: _InflightFetch,
+        cache_key: str,
+        url: str,
+        ttl: int,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Fetch fresh data and replace a cache entry (background thread body).
+        
+        Args:
+            inflight: Record registered in _inflight for cache_key
+            cache_key: Cache key identifier
+            url: API endpoint URL
+            ttl: Cache TTL in seconds
+            params: Query parameters
+            transform: Applied to the fetched data before it is cached
+        """
+        try:
+            cached_entry = self.cache.get_entry(cache_key)
+        except Exception as e:
+            logger.warning(f"Cache read error for {cache_key}: {e}")
+            cached_entry = None
+        
+        try:
+            self._lead_fetch(inflight, cache_key, url, ttl, params, transform, cached_entry)
+        except requests.RequestException as e:
+            logger.warning(f"Background refresh failed for {cache_key}: {e}")
+
+    def _season_ttl(self, season: Optional[int], ttl: int) -> int:
+        """
+        Choose the cache TTL for a season-specific endpoint.
+        
+        Args:
+            season: Season year (None means the current season)
+            ttl: TTL to use while the season is still in progress
+            
+        Returns:
+            CACHE_TTL_PAST_SEASON for completed seasons, otherwise ttl
+        """
+        if season and season < datetime.now().year:
+            return self.CACHE_TTL_PAST_SEASON
+        return ttl
+    
     def get_next_race(self) -> Race:
         """
         Get next scheduled F1 race information.
@@ -236,10 +867,9 @@ class F1DataFetcher:
             race_data = races[0]
             
             # Validate required fields
-            required_fields = ['season', 'round', 'raceName', 'Circuit', 'date']
-            missing_fields = [f for f in required_fields if f not in race_data]
-            if missing_fields:
-                raise ValueError(f"Race data missing required fields: {', '.join(missing_fields)}")
+            missing = _RACE_REQUIRED.difference(race_data)
+            if missing:
+                raise ValueError(f"Race data missing required fields: {', '.join(sorted(missing))}")
             
             return self._parse_race(race_data)
             
@@ -260,17 +890,8 @@ class F1DataFetcher:
         Raises:
             requests.RequestException: If API request fails
         """
-        season_str = str(season) if season else "current"
-        cache_key = f"season_results_{season_str}"
-        url = f"{self.BASE_URL}/{season_str}/results.json"
-        
         try:
-            data = self._get_cached_or_fetch(
-                cache_key,
-                url,
-                self.CACHE_TTL_SEASON_RESULTS,
-                params={"limit": 1000}
-            )
+            data = self._get_season_results_data(season)
         except requests.RequestException as e:
             logger.error(f"Failed to fetch season results: {e}")
             return []  # Return empty list on error
@@ -293,10 +914,10 @@ class F1DataFetcher:
                             result = self._parse_race_result(race, result_data)
                             results.append(result)
                         except (KeyError, ValueError, TypeError) as e:
-                            logger.warning(f"Failed to parse race result: {e}")
+                            logger.debug("Failed to parse race result: %s", e)
                             continue
                 except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse race data: {e}")
+                    logger.debug("Failed to parse race data: %s", e)
                     continue
                     
         except (KeyError, TypeError) as e:
@@ -304,6 +925,174 @@ class F1DataFetcher:
         
         return results
     
+    def _get_season_results_data(self, season: Optional[int]) -> Dict[str, Any]:
+        """
+        Get the raw (slimmed) race results response for a season.
+        
+        The season is fetched in pages of PAGE_SIZE rows and merged into a
+        single response. A completed season's merged response is cached for
+        CACHE_TTL_PAST_SEASON, but only once it holds all of 'MRData.total' rows.
+        
+        Args:
+            season: Season year (uses current season if None)
+            
+        Returns:
+            Decoded API response, with the season's 'total' row count
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        season_str = str(season) if season else "current"
+        cache_key = f"season_results_{season_str}"
+        completed = bool(season) and season < datetime.now().year
+        
+        if self.use_cache and completed:
+            try:
+                cached = self.cache.get(cache_key)
+                if cached is not None and _is_complete_season(cached):
+                    logger.debug("Cache hit: %s", cache_key)
+                    return cached
+            except Exception as e:
+                logger.warning(f"Cache read error for {cache_key}: {e}")
+        
+        # The API serves at most PAGE_SIZE rows per request, so page through
+        # the season; a race can straddle two pages, so merge rows by round.
+        # Pages keep the in-progress TTL until the whole season is assembled.
+        url = f"{self.BASE_URL}/{season_str}/results.json"
+        races_by_round: Dict[Any, Dict[str, Any]] = {}
+        total = 0
+        offset = 0
+        while True:
+            data = self._get_cached_or_fetch(
+                f"{cache_key}_{offset}",
+                url,
+                self.CACHE_TTL_SEASON_RESULTS,
+                params={"limit": self.PAGE_SIZE, "offset": offset},
+                transform=_slim_race_results
+            )
+            
+            try:
+                total = int(data['MRData'].get('total', 0))
+                for race_data in data['MRData'].get('RaceTable', {}).get('Races', []):
+                    rows = race_data.get('Results', [])
+                    merged = races_by_round.get(race_data['round'])
+                    if merged is None:
+                        # Copy so merging never mutates the cached page
+                        races_by_round[race_data['round']] = {**race_data, 'Results': list(rows)}
+                    else:
+                        merged['Results'].extend(rows)
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.warning(f"Failed to parse season results page: {e}")
+                break  # Keep the rounds merged so far; never cached as complete
+            
+            offset += self.PAGE_SIZE
+            if offset >= total:
+                break
+        
+        season_data = {
+            'MRData': {
+                'total': str(total),
+                'RaceTable': {'Races': list(races_by_round.values())}
+            }
+        }
+        
+        if self.use_cache and completed and _is_complete_season(season_data):
+            try:
+                self.cache.set(cache_key, season_data, self.CACHE_TTL_PAST_SEASON)
+            except Exception as e:
+                logger.warning(f"Cache write error for {cache_key}: {e}")
+        
+        return season_data
+    
+    def get_season_results_df(self, season: Optional[int] = None) -> "pd.DataFrame":
+        """
+        Get the numeric race results for a season as a DataFrame.
+        
+        Skips building Race/Driver/RaceResult objects, for callers (e.g. model
+        training) that want columnar data. Drivers and constructors are
+        identified by their API IDs.
+        
+        Args:
+            season: Season year (uses current season if None)
+            
+        Returns:
+            DataFrame with 'season', 'round', 'driverId', 'constructorId',
+            'position', 'grid' and 'points' columns, one row per result
+            (empty if the response holds no results)
+            
+        Raises:
+            requests.RequestException: If API request fails
+        """
+        import pandas as pd  # Deferred: only needed by the DataFrame API
+        
+        # Completed seasons never change, so their decoded frame is cached as
+        # well: a warm cache then unpickles the numeric columns directly
+        # instead of walking the JSON payload again
+        frame_key = None
+        if self.use_cache and season and season < datetime.now().year:
+            frame_key = f"season_results_frame_{season}"
+            try:
+                cached_frame = self.cache.get(frame_key)
+                if cached_frame is not None:
+                    logger.debug("Cache hit: %s", frame_key)
+                    return cached_frame
+            except Exception as e:
+                logger.warning(f"Cache read error for {frame_key}: {e}")
+        
+        # Fetch errors propagate so callers can tell a failed season from an empty one
+        data = self._get_season_results_data(season)
+        races = []
+        total = None
+        try:
+            races = data['MRData'].get('RaceTable', {}).get('Races', [])
+            total = int(data['MRData'].get('total', 0))
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Failed to parse season results structure: {e}")
+        
+        rows = []
+        for race_data in races:
+            try:
+                race_season = int(race_data['season'])
+                race_round = int(race_data['round'])
+                results = race_data.get('Results', [])
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                logger.debug("Failed to parse race data: %s", e)
+                continue
+            for result_data in results:
+                try:
+                    rows.append((
+                        race_season,
+                        race_round,
+                        result_data['Driver']['driverId'],
+                        result_data['Constructor']['constructorId'],
+                        int(result_data['position']),
+                        int(result_data['grid']),
+                        float(result_data['points'])
+                    ))
+                except (KeyError, ValueError, TypeError) as e:
+                    logger.debug("Failed to parse race result: %s", e)
+                    continue
+        
+        # Typed even when empty, so per-season frames concatenate cleanly
+        frame = pd.DataFrame(
+            rows,
+            columns=['season', 'round', 'driverId', 'constructorId', 'position', 'grid', 'points']
+        )
+        frame = frame.astype({
+            'season': 'int16', 'round': 'int16', 'position': 'int16', 'grid': 'int16',
+            'points': 'float32'
+        })
+        
+        # Cache only the complete season: a failed fetch, a short page or a
+        # skipped row would otherwise be served for a year
+        if frame_key is not None and total and len(frame) == total:
+            try:
+                self.cache.set(frame_key, frame, self.CACHE_TTL_PAST_SEASON)
+            except Exception as e:
+                logger.warning(f"Cache write error for {frame_key}: {e}")
+        
+        return frame
+    
     def get_driver_standings(self, season: Optional[int] = None) -> List[DriverStanding]:
         """
         Get current driver championship standings.
@@ -322,7 +1111,9 @@ class F1DataFetcher:
         url = f"{self.BASE_URL}/{season_str}/driverStandings.json"
         
         try:
-            data = self._get_cached_or_fetch(cache_key, url, self.CACHE_TTL_STANDINGS)
+            data = self._get_cached_or_fetch(
+                cache_key, url, self._season_ttl(season, self.CACHE_TTL_STANDINGS)
+            )
         except requests.RequestException as e:
             logger.error(f"Failed to fetch driver standings: {e}")
             return []  # Return empty list on error
@@ -349,7 +1140,7 @@ class F1DataFetcher:
                     standing = self._parse_driver_standing(standing_data)
                     standings.append(standing)
                 except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse driver standing: {e}")
+                    logger.debug("Failed to parse driver standing: %s", e)
                     continue
                     
         except (KeyError, IndexError, TypeError) as e:
@@ -375,7 +1166,9 @@ class F1DataFetcher:
         url = f"{self.BASE_URL}/{season_str}/constructorStandings.json"
         
         try:
-            data = self._get_cached_or_fetch(cache_key, url, self.CACHE_TTL_STANDINGS)
+            data = self._get_cached_or_fetch(
+                cache_key, url, self._season_ttl(season, self.CACHE_TTL_STANDINGS)
+            )
         except requests.RequestException as e:
             logger.error(f"Failed to fetch constructor standings: {e}")
             return []  # Return empty list on error
@@ -402,7 +1195,7 @@ class F1DataFetcher:
                     standing = self._parse_constructor_standing(standing_data)
                     standings.append(standing)
                 except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse constructor standing: {e}")
+                    logger.debug("Failed to parse constructor standing: %s", e)
                     continue
                     
         except (KeyError, IndexError, TypeError) as e:
@@ -410,6 +1203,94 @@ class F1DataFetcher:
         
         return standings
     
+    def _get_standings_rows(self, season: Optional[int], kind: str) -> List[Dict[str, Any]]:
+        """
+        Get the raw standings rows for a season.
+        
+        Args:
+            season: Season year (uses current season if None)
+            kind: 'driver' or 'constructor'
+            
+        Returns:
+            List of standings dictionaries as returned by the API (empty if unavailable)
+        """
+        season_str = str(season) if season else "current"
+        cache_key = f"{kind}_standings_{season_str}"
+        url = f"{self.BASE_URL}/{season_str}/{kind}Standings.json"
+        
+        try:
+            data = self._get_cached_or_fetch(
+                cache_key, url, self._season_ttl(season, self.CACHE_TTL_STANDINGS)
+            )
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {kind} standings: {e}")
+            return []
+        
+        try:
+            standings_lists = data['MRData'].get('StandingsTable', {}).get('StandingsLists', [])
+            if not standings_lists:
+                logger.warning(f"No {kind} standings data available")
+                return []
+            return standings_lists[0].get(f"{kind.capitalize()}Standings", [])
+        except (KeyError, AttributeError, TypeError) as e:
+            logger.error(f"Failed to parse {kind} standings structure: {e}")
+            return []
+    
+    @staticmethod
+    def _standings_frame(rows: List[Dict[str, Any]]) -> "pd.DataFrame":
+        """
+        Flatten standings rows into a DataFrame with compact numeric columns.
+        
+        Args:
+            rows: Standings dictionaries as returned by the API
+            
+        Returns:
+            DataFrame with nested objects flattened to underscore-joined columns
+        """
+        import pandas as pd  # Deferred: only needed by the DataFrame API
+        
+        frame = pd.json_normalize(rows, sep='_')
+        if frame.empty:
+            return frame
+        frame[['position', 'wins']] = frame[['position', 'wins']].astype('int16')
+        frame['points'] = frame['points'].astype('float32')
+        return frame
+    
+    def get_driver_standings_df(self, season: Optional[int] = None) -> "pd.DataFrame":
+        """
+        Get driver championship standings as a DataFrame.
+        
+        Skips building DriverStanding objects, for callers (e.g. model
+        training) that want tabular data. Driver fields are flattened into
+        'Driver_*' columns and the driver's (first) team into 'Constructor_*'.
+        
+        Args:
+            season: Season year (uses current season if None)
+            
+        Returns:
+            DataFrame with one row per driver (empty if unavailable)
+        """
+        rows = self._get_standings_rows(season, 'driver')
+        # Keep only the current team, matching _parse_driver_standing
+        rows = [
+            {**row, 'Constructor': row['Constructors'][0] if row.get('Constructors') else {}}
+            for row in rows
+        ]
+        frame = self._standings_frame(rows)
+        return frame.drop(columns='Constructors', errors='ignore')
+    
+    def get_constructor_standings_df(self, season: Optional[int] = None) -> "pd.DataFrame":
+        """
+        Get constructor championship standings as a DataFrame.
+        
+        Args:
+            season: Season year (uses current season if None)
+            
+        Returns:
+            DataFrame with one row per constructor (empty if unavailable)
+        """
+        return self._standings_frame(self._get_standings_rows(season, 'constructor'))
+    
     def get_qualifying_results(self, season: int, round_num: int) -> List[QualifyingResult]:
         """
         Get qualifying results for specific race.
@@ -424,11 +1305,20 @@ class F1DataFetcher:
         Raises:
             requests.RequestException: If API request fails
         """
+        # Serve from a season bundle already loaded by get_season_qualifying_results()
+        season_rounds = self._season_qualifying.get(season)
+        if season_rounds is not None and round_num in season_rounds:
+            return list(season_rounds[round_num])
+        
         cache_key = f"qualifying_{season}_{round_num}"
         url = f"{self.BASE_URL}/{season}/{round_num}/qualifying.json"
         
         try:
-            data = self._get_cached_or_fetch(cache_key, url, self.CACHE_TTL_QUALIFYING)
+            data = self._get_cached_or_fetch(
+                cache_key, url, self._season_ttl(season, self.CACHE_TTL_QUALIFYING)
+            )
+        except _NoDataError:
+            return []  # Qualifying hasn't happened yet
         except requests.RequestException as e:
             logger.warning(f"Failed to fetch qualifying results: {e}")
             return []  # Return empty list - qualifying may not be available yet
@@ -444,24 +1334,111 @@ class F1DataFetcher:
             races = race_table.get('Races', [])
             
             if races:
-                race_data = races[0]
+                results = self._parse_qualifying_race(races[0])
+            
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Failed to parse qualifying results structure: {e}")
+        
+        return results
+    
+    def get_season_qualifying_results(self, season: int) -> Dict[int, List[QualifyingResult]]:
+        """
+        Get qualifying results for every completed round of a season.
+        
+        The season is fetched in pages of PAGE_SIZE rows. Once loaded,
+        get_qualifying_results() serves rounds of this season from memory,
+        so callers iterating over rounds pay one call per page, not per round.
+        
+        Args:
+            season: Season year
+            
+        Returns:
+            Dictionary mapping round number to QualifyingResult objects
+            (empty dict if unavailable)
+        """
+        url = f"{self.BASE_URL}/{season}/qualifying.json"
+        ttl = self._season_ttl(season, self.CACHE_TTL_QUALIFYING)
+        
+        # The API serves at most PAGE_SIZE rows per request, so page through
+        # the season; a round can straddle two pages, so merge rows by round.
+        # Any failed page discards the season rather than keep partial rounds.
+        races_by_round: Dict[Any, Dict[str, Any]] = {}
+        offset = 0
+        while True:
+            try:
+                data = self._get_cached_or_fetch(
+                    f"qualifying_season_{season}_{offset}",
+                    url,
+                    ttl,
+                    params={"limit": self.PAGE_SIZE, "offset": offset}
+                )
+            except _NoDataError:
+                return {}
+            except requests.RequestException as e:
+                logger.warning(f"Failed to fetch season qualifying results: {e}")
+                return {}  # Per-round lookups fall back to the round endpoint
+            
+            try:
+                if 'MRData' not in data:
+                    logger.warning("Invalid API response: missing 'MRData'")
+                    return {}
+                
+                total = int(data['MRData'].get('total', 0))
+                race_table = data['MRData'].get('RaceTable', {})
+                for race_data in race_table.get('Races', []):
+                    rows = race_data.get('QualifyingResults', [])
+                    merged = races_by_round.get(race_data['round'])
+                    if merged is None:
+                        # Copy so merging never mutates the cached payload
+                        races_by_round[race_data['round']] = {
+                            **race_data, 'QualifyingResults': list(rows)
+                        }
+                    else:
+                        merged['QualifyingResults'].extend(rows)
+                        
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.warning(f"Failed to parse season qualifying structure: {e}")
+                return {}
+            
+            offset += self.PAGE_SIZE
+            if offset >= total:
+                break
+        
+        # Parse response
+        rounds: Dict[int, List[QualifyingResult]] = {}
+        for race_data in races_by_round.values():
+            results = self._parse_qualifying_race(race_data)
+            if results:
+                rounds[results[0].race.round] = results
+        
+        self._season_qualifying[season] = rounds
+        return rounds
+    
+    def _parse_qualifying_race(self, race_data: Dict[str, Any]) -> List[QualifyingResult]:
+        """
+        Parse the qualifying results of one race from API response.
+        
+        Args:
+            race_data: Race entry containing 'QualifyingResults'
+            
+        Returns:
+            List of QualifyingResult objects (empty list if the race is invalid)
+        """
+        results = []
+        try:
+            race = self._parse_race(race_data)
+            qualifying_results = race_data.get('QualifyingResults', [])
+            
+            for qual_data in qualifying_results:
                 try:
-                    race = self._parse_race(race_data)
-                    qualifying_results = race_data.get('QualifyingResults', [])
-                    
-                    for qual_data in qualifying_results:
-                        try:
-                            result = self._parse_qualifying_result(race, qual_data)
-                            results.append(result)
-                        except (KeyError, ValueError, TypeError) as e:
-                            logger.warning(f"Failed to parse qualifying result: {e}")
-                            continue
-                            
+                    result = self._parse_qualifying_result(race, qual_data)
+                    results.append(result)
                 except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse race data: {e}")
+                    logger.debug("Failed to parse qualifying result: %s", e)
+                    continue
                     
-        except (KeyError, TypeError) as e:
-            logger.warning(f"Failed to parse qualifying results structure: {e}")
+        except (KeyError, ValueError, TypeError) as e:
+            logger.debug("Failed to parse race data: %s", e)
         
         return results
     
@@ -469,28 +1446,75 @@ class F1DataFetcher:
         """
         Get historical results for specific circuit.
         
+        Each season is requested separately (concurrently) from the
+        season-scoped endpoint. The all-time circuit endpoint lists races
+        oldest first, so a size-limited request to it returned decades-old
+        races rather than the recent ones.
+        
         Args:
             circuit_id: Circuit identifier (e.g., 'monaco', 'silverstone')
             years: Number of years of history to fetch (default: 5)
             
         Returns:
-            List of RaceResult objects (empty list if unavailable)
+            List of RaceResult objects, oldest season first (empty list if unavailable)
+        """
+        # The current season plus the previous 'years' seasons
+        current_year = datetime.now().year
+        seasons = range(current_year - years, current_year + 1)
+        
+        per_season: List[List[RaceResult]] = [[] for _ in seasons]
+        pending = iter(enumerate(seasons))
+        pending_lock = threading.Lock()
+        
+        def worker() -> None:
+            while True:
+                with pending_lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                index, season = item
+                per_season[index] = self._get_circuit_season_results(circuit_id, season)
+        
+        # Daemon threads rather than a ThreadPoolExecutor, whose workers are
+        # joined at interpreter exit: an abandoned prediction must not wait
+        # on these requests before the process can exit
+        workers = [
+            threading.Thread(target=worker, name=f"history-{circuit_id}", daemon=True)
+            for _ in range(min(self.HISTORY_WORKERS, len(seasons)))
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        
+        return [result for season_results in per_season for result in season_results]
+    
+    def _get_circuit_season_results(self, circuit_id: str, season: int) -> List[RaceResult]:
+        """
+        Get race results at a circuit for one season.
+        
+        Args:
+            circuit_id: Circuit identifier
+            season: Season year
             
-        Raises:
-            requests.RequestException: If API request fails
+        Returns:
+            List of RaceResult objects (empty list if unavailable)
         """
-        cache_key = f"circuit_history_{circuit_id}_{years}"
-        url = f"{self.BASE_URL}/circuits/{circuit_id}/results.json"
+        cache_key = f"circuit_results_{circuit_id}_{season}"
+        url = f"{self.BASE_URL}/{season}/circuits/{circuit_id}/results.json"
         
         try:
             data = self._get_cached_or_fetch(
                 cache_key,
                 url,
-                self.CACHE_TTL_CIRCUIT_HISTORY,
-                params={"limit": years * 30}  # Approximate limit
+                self._season_ttl(season, self.CACHE_TTL_SEASON_RESULTS),
+                params={"limit": 100},
+                transform=_slim_race_results
             )
+        except _NoDataError:
+            return []  # No race at this circuit that season
         except requests.RequestException as e:
-            logger.warning(f"Failed to fetch circuit history: {e}")
+            logger.warning(f"Failed to fetch circuit history for {season}: {e}")
             return []  # Return empty list - circuit history is optional
         
         # Parse response
@@ -500,26 +1524,19 @@ class F1DataFetcher:
                 logger.warning("Invalid API response: missing 'MRData'")
                 return []
             
-            race_table = data['MRData'].get('RaceTable', {})
-            races = race_table.get('Races', [])
-            
-            # Get only the most recent 'years' worth of races
-            current_year = datetime.now().year
-            cutoff_year = current_year - years
-            
+            races = data['MRData'].get('RaceTable', {}).get('Races', [])
             for race_data in races:
                 try:
                     race = self._parse_race(race_data)
-                    if race.season >= cutoff_year:
-                        for result_data in race_data.get('Results', []):
-                            try:
-                                result = self._parse_race_result(race, result_data)
-                                results.append(result)
-                            except (KeyError, ValueError, TypeError) as e:
-                                logger.warning(f"Failed to parse race result: {e}")
-                                continue
+                    for result_data in race_data.get('Results', []):
+                        try:
+                            result = self._parse_race_result(race, result_data)
+                            results.append(result)
+                        except (KeyError, ValueError, TypeError) as e:
+                            logger.debug("Failed to parse race result: %s", e)
+                            continue
                 except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse race data: {e}")
+                    logger.debug("Failed to parse race data: %s", e)
                     continue
                     
         except (KeyError, TypeError) as e:
@@ -530,64 +1547,84 @@ class F1DataFetcher:
     # Helper methods for parsing API responses
     
     def _parse_circuit(self, circuit_data: Dict[str, Any]) -> Circuit:
-        """Parse circuit data from API response."""
-        required_fields = ['circuitId', 'circuitName', 'Location']
-        for field in required_fields:
-            if field not in circuit_data:
-                raise ValueError(f"Circuit data missing required field: {field}")
+        """Parse circuit data from API response (shared instance per circuit ID)."""
+        # Validate before the shared-instance lookup so null or non-dict
+        # payloads raise TypeError like any other malformed entity
+        missing = _CIRCUIT_REQUIRED.difference(circuit_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Circuit data missing required field: {fields}")
+        
+        circuit = self._circuit_cache.get(circuit_data['circuitId'])
+        if circuit is not None:
+            return circuit
         
         location = circuit_data['Location']
         if 'locality' not in location or 'country' not in location:
             raise ValueError("Circuit location data incomplete")
         
-        return Circuit(
+        circuit = Circuit(
             circuit_id=circuit_data['circuitId'],
             circuit_name=circuit_data['circuitName'],
             location=location['locality'],
             country=location['country']
         )
+        return self._circuit_cache.setdefault(circuit.circuit_id, circuit)
     
     def _parse_driver(self, driver_data: Dict[str, Any]) -> Driver:
-        """Parse driver data from API response."""
-        required_fields = ['driverId', 'givenName', 'familyName', 'nationality']
-        for field in required_fields:
-            if field not in driver_data:
-                raise ValueError(f"Driver data missing required field: {field}")
+        """Parse driver data from API response (shared instance per driver ID)."""
+        # Validate before the shared-instance lookup so null or non-dict
+        # payloads raise TypeError like any other malformed entity
+        missing = _DRIVER_REQUIRED.difference(driver_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Driver data missing required field: {fields}")
+        
+        driver = self._driver_cache.get(driver_data['driverId'])
+        if driver is not None:
+            return driver
         
-        return Driver(
+        driver = Driver(
             driver_id=driver_data['driverId'],
             code=driver_data.get('code', '???'),  # Some drivers may not have a code
             forename=driver_data['givenName'],
             surname=driver_data['familyName'],
             nationality=driver_data['nationality']
         )
+        return self._driver_cache.setdefault(driver.driver_id, driver)
     
     def _parse_constructor(self, constructor_data: Dict[str, Any]) -> Constructor:
-        """Parse constructor data from API response."""
-        required_fields = ['constructorId', 'name', 'nationality']
-        for field in required_fields:
-            if field not in constructor_data:
-                raise ValueError(f"Constructor data missing required field: {field}")
+        """Parse constructor data from API response (shared instance per constructor ID)."""
+        # Validate before the shared-instance lookup so null or non-dict
+        # payloads raise TypeError like any other malformed entity
+        missing = _CONSTRUCTOR_REQUIRED.difference(constructor_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Constructor data missing required field: {fields}")
         
-        return Constructor(
+        constructor = self._constructor_cache.get(constructor_data['constructorId'])
+        if constructor is not None:
+            return constructor
+        
+        constructor = Constructor(
             constructor_id=constructor_data['constructorId'],
             name=constructor_data['name'],
             nationality=constructor_data['nationality']
         )
+        return self._constructor_cache.setdefault(constructor.constructor_id, constructor)
     
     def _parse_race(self, race_data: Dict[str, Any]) -> Race:
         """Parse race data from API response."""
-        required_fields = ['season', 'round', 'raceName', 'Circuit', 'date']
-        for field in required_fields:
-            if field not in race_data:
-                raise ValueError(f"Race data missing required field: {field}")
+        missing = _RACE_REQUIRED.difference(race_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Race data missing required field: {fields}")
         
         # Parse date and time
         try:
-            date_str = race_data['date']
-            time_str = race_data.get('time', '00:00:00Z')
-            datetime_str = f"{date_str}T{time_str.rstrip('Z')}"
-            race_date = datetime.fromisoformat(datetime_str)
+            race_date = _parse_race_datetime(
+                race_data['date'], race_data.get('time', '00:00:00Z')
+            )
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid race date/time format: {e}")
         
@@ -601,10 +1638,10 @@ class F1DataFetcher:
     
     def _parse_race_result(self, race: Race, result_data: Dict[str, Any]) -> RaceResult:
         """Parse race result data from API response."""
-        required_fields = ['Driver', 'Constructor', 'position', 'points', 'grid', 'laps', 'status']
-        for field in required_fields:
-            if field not in result_data:
-                raise ValueError(f"Race result data missing required field: {field}")
+        missing = _RACE_RESULT_REQUIRED.difference(result_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Race result data missing required field: {fields}")
         
         try:
             return RaceResult(
@@ -622,10 +1659,10 @@ class F1DataFetcher:
     
     def _parse_qualifying_result(self, race: Race, qual_data: Dict[str, Any]) -> QualifyingResult:
         """Parse qualifying result data from API response."""
-        required_fields = ['Driver', 'Constructor', 'position']
-        for field in required_fields:
-            if field not in qual_data:
-                raise ValueError(f"Qualifying result data missing required field: {field}")
+        missing = _QUALIFYING_RESULT_REQUIRED.difference(qual_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Qualifying result data missing required field: {fields}")
         
         try:
             return QualifyingResult(
@@ -642,10 +1679,10 @@ class F1DataFetcher:
     
     def _parse_driver_standing(self, standing_data: Dict[str, Any]) -> DriverStanding:
         """Parse driver standing data from API response."""
-        required_fields = ['Driver', 'Constructors', 'position', 'points', 'wins']
-        for field in required_fields:
-            if field not in standing_data:
-                raise ValueError(f"Driver standing data missing required field: {field}")
+        missing = _DRIVER_STANDING_REQUIRED.difference(standing_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Driver standing data missing required field: {fields}")
         
         if not standing_data['Constructors']:
             raise ValueError("Driver standing missing constructor information")
@@ -663,10 +1700,10 @@ class F1DataFetcher:
     
     def _parse_constructor_standing(self, standing_data: Dict[str, Any]) -> ConstructorStanding:
         """Parse constructor standing data from API response."""
-        required_fields = ['Constructor', 'position', 'points', 'wins']
-        for field in required_fields:
-            if field not in standing_data:
-                raise ValueError(f"Constructor standing data missing required field: {field}")
+        missing = _CONSTRUCTOR_STANDING_REQUIRED.difference(standing_data)
+        if missing:
+            fields = ', '.join(sorted(missing))
+            raise ValueError(f"Constructor standing data missing required field: {fields}")
         
         try:
             return ConstructorStanding(
@@ -677,3 +1714,27 @@ class F1DataFetcher:
             )
         except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid constructor standing data types: {e}")
+
+
+_DEFAULT_FETCHER: Optional[F1DataFetcher] = None
+_DEFAULT_FETCHER_LOCK = threading.Lock()
+
+
+def get_fetcher() -> F1DataFetcher:
+    """
+    Get the process-wide shared fetcher, creating it on first use.
+    
+    Sharing one instance keeps a single connection pool (so TCP/TLS handshakes
+    are amortized across all callers), one in-memory cache and one view of the
+    API rate limit. Construct F1DataFetcher directly only when a separate cache
+    or configuration is needed, e.g. in tests.
+    
+    Returns:
+        Shared F1DataFetcher using the default cache
+    """
+    global _DEFAULT_FETCHER
+    if _DEFAULT_FETCHER is None:
+        with _DEFAULT_FETCHER_LOCK:
+            if _DEFAULT_FETCHER is None:
+                _DEFAULT_FETCHER = F1DataFetcher()
+    return _DEFAULT_FETCHER
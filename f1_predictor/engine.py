@@ -6,28 +6,144 @@ Handles data fetching, validation, analysis, and formatting.
 """
 
 import logging
-from datetime import datetime
-from typing import Optional, List
+import threading
+from concurrent.futures import Future, wait as wait_futures
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Sequence, Tuple
 import sys
-import requests
 
 from f1_predictor.models import (
     Race, PredictionResult, PredictionError,
-    DriverStanding, ConstructorStanding, RaceResult, QualifyingResult
+    DriverStanding, ConstructorStanding, RaceResult
 )
-from f1_predictor.data_fetcher import F1DataFetcher
-from f1_predictor.cache import DataCache
-from f1_predictor.analyzer import PredictionAnalyzer
-from f1_predictor.formatter import ResultFormatter
+from f1_predictor.formatter import HEAVY_RULE, ResultFormatter
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Data validation rules as (predicate, warning message builder) pairs
+_Validator = Tuple[Callable[[Any], bool], Callable[[Any], str]]
+
+_RACE_VALIDATORS: Tuple[_Validator, ...] = (
+    (lambda race: not race.race_name, lambda race: "Race name is missing"),
+    (
+        lambda race: not race.circuit or not race.circuit.circuit_id,
+        lambda race: "Circuit information is incomplete"
+    ),
+    (lambda race: not race.date, lambda race: "Race date is missing"),
+    (
+        lambda race: race.season < 1950 or race.season > datetime.now().year + 1,
+        lambda race: f"Race season {race.season} seems invalid"
+    ),
+)
+
+_DRIVER_STANDINGS_VALIDATORS: Tuple[_Validator, ...] = (
+    (lambda standings: not standings, lambda standings: "No driver standings data available"),
+    (
+        lambda standings: 0 < len(standings) < 10,
+        lambda standings: f"Limited driver standings data ({len(standings)} drivers)"
+    ),
+)
+
+_CONSTRUCTOR_STANDINGS_VALIDATORS: Tuple[_Validator, ...] = (
+    (
+        lambda standings: not standings,
+        lambda standings: "No constructor standings data available"
+    ),
+    (
+        lambda standings: 0 < len(standings) < 5,
+        lambda standings: f"Limited constructor standings data ({len(standings)} teams)"
+    ),
+)
+
+_RESULTS_VALIDATORS: Tuple[_Validator, ...] = (
+    (lambda results: not results, lambda results: "No race results data available"),
+    (
+        lambda results: 0 < len(results) < 20,
+        lambda results: f"Limited race results data ({len(results)} results)"
+    ),
+)
+
+# Suggestions shown with each kind of prediction error
+_NETWORK_SUGGESTIONS = (
+    "Check your internet connection",
+    "Verify the API is accessible",
+    "Try again later",
+    "Use --no-cache flag to bypass cache"
+)
+_NEXT_RACE_SUGGESTIONS = (
+    "Check if the F1 season is currently active",
+    "Verify API connectivity",
+    "Check if there are any scheduled races",
+    "Try again later"
+)
+_STANDINGS_SUGGESTIONS = (
+    "Check if the F1 season has started",
+    "Verify API is returning valid data",
+    "Try again later"
+)
+_MISSING_STANDINGS_SUGGESTIONS = (
+    "Check if the F1 season has started",
+    "Verify API connectivity",
+    "Try again later"
+)
+_ANALYSIS_SUGGESTIONS = (
+    "Check data quality",
+    "Verify sufficient historical data exists",
+    "Try again later"
+)
+_UNEXPECTED_SUGGESTIONS = (
+    "Check your internet connection",
+    "Verify the API is accessible",
+    "Check logs for more details",
+    "Try again later"
+)
+
+
+def _prediction_error(
+    error_type: str,
+    message: str,
+    suggestions: Sequence[str],
+    recoverable: bool = True
+) -> PredictionError:
+    """
+    Build a PredictionError with its own copy of a shared suggestions tuple.
+    
+    Args:
+        error_type: Error category (e.g. "NetworkError")
+        message: Human-readable error message
+        suggestions: Suggested remedies
+        recoverable: Whether retrying may succeed
+        
+    Returns:
+        PredictionError ready to raise
+    """
+    return PredictionError(
+        error_type=error_type,
+        message=message,
+        suggestions=list(suggestions),
+        recoverable=recoverable
+    )
+
+
+def _network_error(message: str) -> PredictionError:
+    """Build the recoverable error raised when a required API request fails."""
+    return _prediction_error("NetworkError", message, _NETWORK_SUGGESTIONS)
+
+
+def _run_validators(validators: Sequence[_Validator], value: Any) -> List[str]:
+    """
+    Apply validation rules to a value.
+    
+    Args:
+        validators: (predicate, message builder) pairs
+        value: Value to validate
+        
+    Returns:
+        Warning messages for each rule whose predicate holds
+    """
+    return [message(value) for predicate, message in validators if predicate(value)]
+
 
 class PredictionEngine:
     """
@@ -37,13 +153,17 @@ class PredictionEngine:
     to generate comprehensive race winner predictions.
     """
     
+    # Qualifying can't exist yet for races further away than this
+    QUALIFYING_WINDOW_DAYS = 3
+    
     def __init__(
         self,
         use_cache: bool = True,
         cache_dir: str = ".f1_cache",
         top_n: int = 3,
         verbose: bool = False,
-        use_ml: bool = False
+        use_ml: bool = False,
+        force_full_fetch: bool = False
     ):
         """
         Initialize the prediction engine.
@@ -54,15 +174,25 @@ class PredictionEngine:
             top_n: Number of top predictions to generate (default: 3)
             verbose: Whether to show detailed output (default: False)
             use_ml: Whether to use ML model instead of statistical analysis (default: False)
+            force_full_fetch: Fetch qualifying results even when the race is more
+                than QUALIFYING_WINDOW_DAYS away (default: False)
         """
         self.use_cache = use_cache
         self.top_n = top_n
         self.verbose = verbose
         self.use_ml = use_ml
+        self.force_full_fetch = force_full_fetch
+        
+        # Imported here so that loading this module (e.g. for format_error)
+        # doesn't pull in requests and the analysis stack
+        from f1_predictor.cache import DataCache
+        from f1_predictor.data_fetcher import F1DataFetcher
         
         # Initialize components
         self.cache = DataCache(cache_dir) if use_cache else None
         self.data_fetcher = F1DataFetcher(cache=self.cache, use_cache=use_cache)
+        # Fetches issued by the current prediction, joined by close(wait=True)
+        self._futures: List[Future] = []
         
         # Choose analyzer based on mode
         if use_ml:
@@ -70,15 +200,61 @@ class PredictionEngine:
             self.analyzer = MLPredictionAnalyzer()
             logger.info("Using ML-based prediction analyzer")
         else:
+            from f1_predictor.analyzer import PredictionAnalyzer
             self.analyzer = PredictionAnalyzer()
             logger.info("Using statistical prediction analyzer")
         
         self.formatter = ResultFormatter()
         
         logger.info("Prediction engine initialized")
-        logger.info(f"Cache enabled: {use_cache}")
-        logger.info(f"Top predictions: {top_n}")
+        logger.info("Cache enabled: %s", use_cache)
+        logger.info("Top predictions: %d", top_n)
 
+    def close(self, wait: bool = True) -> None:
+        """
+        Release HTTP connections and persist cached data.
+        
+        Args:
+            wait: Whether to wait for outstanding fetches to finish. Pass False
+                when a prediction was interrupted or failed: running fetches are
+                abandoned, and since they run on daemon threads they cannot
+                keep the process alive at exit.
+        """
+        if wait:
+            wait_futures(self._futures)
+        self._futures.clear()
+        self.data_fetcher.close()
+        if self.cache:
+            self.cache.flush()
+    
+    def __enter__(self) -> "PredictionEngine":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(wait=exc_type is None)
+    
+    def _submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Run a fetch on its own daemon thread, tracking it for close().
+        
+        concurrent.futures joins its worker threads at interpreter exit even
+        after shutdown(wait=False), so an abandoned fetch would hold the
+        process open through its timeouts and retries; daemon threads are not.
+        """
+        future: Future = Future()
+        
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name="f1-fetch", daemon=True).start()
+        self._futures.append(future)
+        return future
+    
     def _show_progress(self, message: str) -> None:
         """
         Display progress indicator to user.
@@ -100,21 +276,7 @@ class PredictionEngine:
         Returns:
             List of validation warnings (empty if all valid)
         """
-        warnings = []
-        
-        if not race.race_name:
-            warnings.append("Race name is missing")
-        
-        if not race.circuit or not race.circuit.circuit_id:
-            warnings.append("Circuit information is incomplete")
-        
-        if not race.date:
-            warnings.append("Race date is missing")
-        
-        if race.season < 1950 or race.season > datetime.now().year + 1:
-            warnings.append(f"Race season {race.season} seems invalid")
-        
-        return warnings
+        return _run_validators(_RACE_VALIDATORS, race)
     
     def _validate_standings_data(
         self,
@@ -131,19 +293,10 @@ class PredictionEngine:
         Returns:
             List of validation warnings (empty if all valid)
         """
-        warnings = []
-        
-        if not driver_standings:
-            warnings.append("No driver standings data available")
-        elif len(driver_standings) < 10:
-            warnings.append(f"Limited driver standings data ({len(driver_standings)} drivers)")
-        
-        if not constructor_standings:
-            warnings.append("No constructor standings data available")
-        elif len(constructor_standings) < 5:
-            warnings.append(f"Limited constructor standings data ({len(constructor_standings)} teams)")
-        
-        return warnings
+        return (
+            _run_validators(_DRIVER_STANDINGS_VALIDATORS, driver_standings)
+            + _run_validators(_CONSTRUCTOR_STANDINGS_VALIDATORS, constructor_standings)
+        )
     
     def _validate_results_data(self, results: List[RaceResult]) -> List[str]:
         """
@@ -155,14 +308,7 @@ class PredictionEngine:
         Returns:
             List of validation warnings (empty if all valid)
         """
-        warnings = []
-        
-        if not results:
-            warnings.append("No race results data available")
-        elif len(results) < 20:
-            warnings.append(f"Limited race results data ({len(results)} results)")
-        
-        return warnings
+        return _run_validators(_RESULTS_VALIDATORS, results)
     
     def _log_data_quality_issues(self, warnings: List[str]) -> None:
         """
@@ -174,7 +320,7 @@ class PredictionEngine:
         if warnings:
             logger.warning("Data quality issues detected:")
             for warning in warnings:
-                logger.warning(f"  - {warning}")
+                logger.warning("  - %s", warning)
 
     def predict_next_race(self) -> PredictionResult:
         """
@@ -195,34 +341,22 @@ class PredictionEngine:
         Raises:
             PredictionError: If prediction cannot be generated
         """
+        from requests import RequestException  # Loaded by the fetcher already
+        
         try:
             # Step 1: Get next race information
             self._show_progress("Fetching next race information...")
             try:
                 race = self.data_fetcher.get_next_race()
             except ValueError as e:
-                raise PredictionError(
-                    error_type="DataError",
-                    message=f"Failed to retrieve next race information: {str(e)}",
-                    suggestions=[
-                        "Check if the F1 season is currently active",
-                        "Verify API connectivity",
-                        "Check if there are any scheduled races",
-                        "Try again later"
-                    ],
-                    recoverable=True
+                raise _prediction_error(
+                    "DataError",
+                    f"Failed to retrieve next race information: {str(e)}",
+                    _NEXT_RACE_SUGGESTIONS
                 )
-            except requests.RequestException as e:
-                raise PredictionError(
-                    error_type="NetworkError",
-                    message=f"Network error while fetching race information: {str(e)}",
-                    suggestions=[
-                        "Check your internet connection",
-                        "Verify the API is accessible",
-                        "Try again later",
-                        "Use --no-cache flag to bypass cache"
-                    ],
-                    recoverable=True
+            except RequestException as e:
+                raise _network_error(
+                    f"Network error while fetching race information: {str(e)}"
                 )
             
             # Validate race data
@@ -230,36 +364,41 @@ class PredictionEngine:
             if race_warnings:
                 self._log_data_quality_issues(race_warnings)
             
-            logger.info(f"Next race: {race.race_name} at {race.circuit.circuit_name}")
-            logger.info(f"Date: {race.date.strftime('%Y-%m-%d')}")
+            logger.info("Next race: %s at %s", race.race_name, race.circuit.circuit_name)
+            logger.info("Date: %s", race.date.date())
+            
+            # Steps 2-5 only depend on the race, so issue their requests
+            # concurrently and collect each result when it is needed
+            fetcher = self.data_fetcher
+            self._futures = []
+            driver_standings_future = self._submit(fetcher.get_driver_standings, race.season)
+            constructor_standings_future = self._submit(
+                fetcher.get_constructor_standings, race.season
+            )
+            season_results_future = self._submit(fetcher.get_current_season_results, race.season)
+            # Race dates are naive UTC
+            days_until = race.date - datetime.now(timezone.utc).replace(tzinfo=None)
+            qualifying_future = None
+            if self.force_full_fetch or days_until <= timedelta(days=self.QUALIFYING_WINDOW_DAYS):
+                qualifying_future = self._submit(
+                    fetcher.get_qualifying_results, race.season, race.round
+                )
+            circuit_history_future = self._submit(
+                fetcher.get_circuit_history, race.circuit.circuit_id, years=5
+            )
             
             # Step 2: Get current season standings
             self._show_progress("Fetching driver and constructor standings...")
             try:
-                driver_standings = self.data_fetcher.get_driver_standings(race.season)
-                constructor_standings = self.data_fetcher.get_constructor_standings(race.season)
-            except requests.RequestException as e:
-                raise PredictionError(
-                    error_type="NetworkError",
-                    message=f"Network error while fetching standings: {str(e)}",
-                    suggestions=[
-                        "Check your internet connection",
-                        "Verify the API is accessible",
-                        "Try again later",
-                        "Use --no-cache flag to bypass cache"
-                    ],
-                    recoverable=True
-                )
+                driver_standings = driver_standings_future.result()
+                constructor_standings = constructor_standings_future.result()
+            except RequestException as e:
+                raise _network_error(f"Network error while fetching standings: {str(e)}")
             except Exception as e:
-                raise PredictionError(
-                    error_type="DataError",
-                    message=f"Failed to retrieve standings data: {str(e)}",
-                    suggestions=[
-                        "Check if the F1 season has started",
-                        "Verify API is returning valid data",
-                        "Try again later"
-                    ],
-                    recoverable=True
+                raise _prediction_error(
+                    "DataError",
+                    f"Failed to retrieve standings data: {str(e)}",
+                    _STANDINGS_SUGGESTIONS
                 )
             
             # Validate standings data
@@ -270,30 +409,26 @@ class PredictionEngine:
                 self._log_data_quality_issues(standings_warnings)
             
             if not driver_standings:
-                raise PredictionError(
-                    error_type="MissingData",
-                    message="Cannot generate predictions without driver standings data",
-                    suggestions=[
-                        "Check if the F1 season has started",
-                        "Verify API connectivity",
-                        "Try again later"
-                    ],
+                raise _prediction_error(
+                    "MissingData",
+                    "Cannot generate predictions without driver standings data",
+                    _MISSING_STANDINGS_SUGGESTIONS,
                     recoverable=False
                 )
             
-            logger.info(f"Loaded {len(driver_standings)} driver standings")
-            logger.info(f"Loaded {len(constructor_standings)} constructor standings")
+            logger.info("Loaded %d driver standings", len(driver_standings))
+            logger.info("Loaded %d constructor standings", len(constructor_standings))
             
             # Step 3: Get current season results for form calculation
             self._show_progress("Fetching current season race results...")
             try:
-                season_results = self.data_fetcher.get_current_season_results(race.season)
-            except requests.RequestException as e:
-                logger.warning(f"Network error fetching season results: {e}")
+                season_results = season_results_future.result()
+            except RequestException as e:
+                logger.warning("Network error fetching season results: %s", e)
                 logger.warning("Predictions will be generated with limited form data")
                 season_results = []
             except Exception as e:
-                logger.warning(f"Failed to fetch season results: {e}")
+                logger.warning("Failed to fetch season results: %s", e)
                 logger.warning("Predictions will be generated with limited form data")
                 season_results = []
             
@@ -302,42 +437,44 @@ class PredictionEngine:
             if results_warnings:
                 self._log_data_quality_issues(results_warnings)
             
-            logger.info(f"Loaded {len(season_results)} race results from current season")
+            logger.info("Loaded %d race results from current season", len(season_results))
             
             # Step 4: Get qualifying results (may not be available yet)
             self._show_progress("Fetching qualifying results...")
             qualifying_results = []
-            try:
-                qualifying_results = self.data_fetcher.get_qualifying_results(
-                    race.season, race.round
+            if qualifying_future is None:
+                logger.info(
+                    "Race is more than %d days away, skipping qualifying fetch",
+                    self.QUALIFYING_WINDOW_DAYS
                 )
-                if qualifying_results:
-                    logger.info(f"Loaded {len(qualifying_results)} qualifying results")
-                else:
-                    logger.info("Qualifying results not yet available")
-            except requests.RequestException as e:
-                logger.warning(f"Network error fetching qualifying results: {e}")
-                logger.info("Predictions will be generated without qualifying data")
-            except Exception as e:
-                logger.warning(f"Unexpected error fetching qualifying results: {e}")
-                logger.info("Predictions will be generated without qualifying data")
+            else:
+                try:
+                    qualifying_results = qualifying_future.result()
+                    if qualifying_results:
+                        logger.info("Loaded %d qualifying results", len(qualifying_results))
+                    else:
+                        logger.info("Qualifying results not yet available")
+                except RequestException as e:
+                    logger.warning("Network error fetching qualifying results: %s", e)
+                    logger.info("Predictions will be generated without qualifying data")
+                except Exception as e:
+                    logger.warning("Unexpected error fetching qualifying results: %s", e)
+                    logger.info("Predictions will be generated without qualifying data")
             
             # Step 5: Get circuit history
             self._show_progress("Fetching circuit history...")
             circuit_history = []
             try:
-                circuit_history = self.data_fetcher.get_circuit_history(
-                    race.circuit.circuit_id, years=5
-                )
+                circuit_history = circuit_history_future.result()
                 if circuit_history:
-                    logger.info(f"Loaded {len(circuit_history)} historical results for circuit")
+                    logger.info("Loaded %d historical results for circuit", len(circuit_history))
                 else:
                     logger.info("No circuit history available")
-            except requests.RequestException as e:
-                logger.warning(f"Network error fetching circuit history: {e}")
+            except RequestException as e:
+                logger.warning("Network error fetching circuit history: %s", e)
                 logger.info("Predictions will be generated without circuit history")
             except Exception as e:
-                logger.warning(f"Unexpected error fetching circuit history: {e}")
+                logger.warning("Unexpected error fetching circuit history: %s", e)
                 logger.info("Predictions will be generated without circuit history")
             
             # Step 6: Generate predictions
@@ -353,29 +490,30 @@ class PredictionEngine:
             )
             
             if not predictions:
-                raise PredictionError(
-                    error_type="AnalysisError",
-                    message="Failed to generate predictions from available data",
-                    suggestions=[
-                        "Check data quality",
-                        "Verify sufficient historical data exists",
-                        "Try again later"
-                    ],
+                raise _prediction_error(
+                    "AnalysisError",
+                    "Failed to generate predictions from available data",
+                    _ANALYSIS_SUGGESTIONS,
                     recoverable=False
                 )
             
-            logger.info(f"Generated {len(predictions)} predictions")
+            logger.info("Generated %d predictions", len(predictions))
             
-            # Step 7: Calculate data completeness
-            data_completeness = self._calculate_data_completeness(
-                qualifying_results, circuit_history
+            # Step 7: Calculate data completeness (the same figure the
+            # analyzer scaled each confidence by)
+            data_completeness = self.analyzer.calculate_data_completeness(
+                driver_standings,
+                constructor_standings,
+                season_results,
+                qualifying_results,
+                circuit_history
             )
             
             # Step 8: Create prediction result
             result = PredictionResult(
                 race=race,
                 predictions=predictions,
-                generated_at=datetime.utcnow(),
+                generated_at=datetime.now(timezone.utc),
                 data_sources=["Jolpica F1 API"],
                 data_completeness=data_completeness
             )
@@ -389,52 +527,13 @@ class PredictionEngine:
             raise
             
         except Exception as e:
-            logger.error(f"Unexpected error during prediction: {e}", exc_info=True)
-            raise PredictionError(
-                error_type="UnexpectedError",
-                message=f"An unexpected error occurred: {str(e)}",
-                suggestions=[
-                    "Check your internet connection",
-                    "Verify the API is accessible",
-                    "Check logs for more details",
-                    "Try again later"
-                ],
-                recoverable=True
+            logger.error("Unexpected error during prediction: %s", e, exc_info=True)
+            raise _prediction_error(
+                "UnexpectedError",
+                f"An unexpected error occurred: {str(e)}",
+                _UNEXPECTED_SUGGESTIONS
             )
 
-    def _calculate_data_completeness(
-        self,
-        qualifying_results: Optional[List[QualifyingResult]],
-        circuit_history: Optional[List[RaceResult]]
-    ) -> float:
-        """
-        Calculate data completeness factor.
-        
-        Tracks which data sources are available:
-        - Driver standings (always required)
-        - Constructor standings (always required)
-        - Season results (always required)
-        - Qualifying results (optional)
-        - Circuit history (optional)
-        
-        Args:
-            qualifying_results: Qualifying results if available
-            circuit_history: Circuit history if available
-            
-        Returns:
-            Data completeness factor from 0.0 to 1.0
-        """
-        total_sources = 5
-        available_sources = 3  # Standings and season results always available
-        
-        if qualifying_results is not None and len(qualifying_results) > 0:
-            available_sources += 1
-        
-        if circuit_history is not None and len(circuit_history) > 0:
-            available_sources += 1
-        
-        return available_sources / total_sources
-    
     def format_result(self, result: PredictionResult) -> str:
         """
         Format prediction result for display.
@@ -457,17 +556,12 @@ class PredictionEngine:
         Returns:
             Formatted error message string
         """
-        lines = []
-        lines.append("═" * 65)
-        lines.append(f"ERROR: {error.error_type}")
-        lines.append("═" * 65)
-        lines.append(f"\n{error.message}\n")
-        
-        if error.suggestions:
-            lines.append("Suggestions:")
-            for suggestion in error.suggestions:
-                lines.append(f"  • {suggestion}")
-        
-        lines.append("\n" + "═" * 65)
-        
-        return "\n".join(lines)
+        suggestions = "".join(f"  • {suggestion}\n" for suggestion in error.suggestions or ())
+        if suggestions:
+            suggestions = f"Suggestions:\n{suggestions}"
+        
+        return (
+            f"{HEAVY_RULE}\nERROR: {error.error_type}\n{HEAVY_RULE}\n"
+            f"\n{error.message}\n\n"
+            f"{suggestions}\n{HEAVY_RULE}"
+        )
@@ -1,8 +1,37 @@
 """Result formatter for F1 Race Predictor."""
 
-from typing import List
+from typing import Iterator, List
 from f1_predictor.models import PredictionResult, DriverPrediction
 
+# Section separators shared by all console output
+HEAVY_RULE = "═" * 65
+LIGHT_RULE = "─" * 65
+
+# English month names, independent of the process locale (unlike strftime's %B)
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
+# Factor keys with their display names, in display order
+_FACTOR_NAMES = (
+    ('championship', 'Championship Position'),
+    ('form', 'Recent Form'),
+    ('team', 'Team Performance'),
+    ('qualifying', 'Qualifying Position'),
+    ('circuit', 'Circuit History'),
+)
+
+# Box-drawing borders for format_table()
+_TABLE_HEADER = "\n".join((
+    "┌──────┬─────────────────────────┬──────────────────────┬────────────┐",
+    "│ Rank │ Driver                  │ Team                 │ Confidence │",
+    "├──────┼─────────────────────────┼──────────────────────┼────────────┤",
+))
+_TABLE_FOOTER = "└──────┴─────────────────────────┴──────────────────────┴────────────┘"
+# Precision truncates and width pads each column in one step
+_TABLE_ROW = "│  {rank:<2}  │ {driver:<23.23} │ {team:<20.20} │ {confidence:>10} │"
+
 
 class ResultFormatter:
     """Formats prediction results for display."""
@@ -11,6 +40,9 @@ class ResultFormatter:
         """
         Format predictions for console output.
         
+        The result is formatted once per verbose setting; repeated calls return
+        the string cached on the result.
+        
         Args:
             result: The prediction result to format
             verbose: Whether to show detailed factor breakdowns
@@ -18,58 +50,75 @@ class ResultFormatter:
         Returns:
             Formatted string ready for display
         """
-        output = []
-        
+        formatted = result._formatted_cache.get(verbose)
+        if formatted is None:
+            formatted = result._formatted_cache[verbose] = self._format_prediction(
+                result, verbose
+            )
+        return formatted
+    
+    def _format_prediction(self, result: PredictionResult, verbose: bool) -> str:
+        """Format predictions for console output (uncached)."""
+        return "\n".join(self._iter_prediction_lines(result, verbose))
+    
+    def _iter_prediction_lines(self, result: PredictionResult, verbose: bool) -> Iterator[str]:
+        """Yield the lines of the full prediction report."""
         # Header
-        output.append("F1 Race Winner Prediction")
-        output.append("═" * 65)
+        race = result.race
+        yield "F1 Race Winner Prediction"
+        yield HEAVY_RULE
         
         # Race information
-        race = result.race
-        output.append(f"Race: {race.race_name}")
-        output.append(f"Circuit: {race.circuit.circuit_name}")
-        output.append(f"Location: {race.circuit.location}, {race.circuit.country}")
-        output.append(f"Date: {race.date.strftime('%B %d, %Y')}")
-        output.append("")
+        yield f"Race: {race.race_name}"
+        yield f"Circuit: {race.circuit.circuit_name}"
+        yield f"Location: {race.circuit.location}, {race.circuit.country}"
+        date = race.date
+        yield f"Date: {_MONTHS[date.month - 1]} {date.day:02d}, {date.year}"
+        yield ""
         
         # Predictions
-        output.append(f"TOP {len(result.predictions)} PREDICTIONS:")
-        output.append("─" * 65)
+        yield f"TOP {len(result.predictions)} PREDICTIONS:"
+        yield LIGHT_RULE
         
-        for i, prediction in enumerate(result.predictions, 1):
-            output.append(self._format_single_prediction(i, prediction, verbose))
-            if i < len(result.predictions):
-                output.append("")
+        # One block per prediction, separated by a blank line
+        if result.predictions:
+            yield "\n\n".join(
+                "\n".join(self._iter_single_prediction(i, prediction, verbose))
+                for i, prediction in enumerate(result.predictions, 1)
+            )
         
         # Footer
-        output.append("─" * 65)
-        output.append(f"Prediction generated: {result.generated_at.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        output.append(f"Data sources: {', '.join(result.data_sources)}")
-        output.append(f"Data completeness: {result.data_completeness * 100:.1f}%")
-        
-        return "\n".join(output)
+        yield LIGHT_RULE
+        yield f"Prediction generated: {result.generated_at.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        yield f"Data sources: {', '.join(result.data_sources)}"
+        yield f"Data completeness: {result.data_completeness * 100:.1f}%"
     
-    def _format_single_prediction(self, rank: int, prediction: DriverPrediction, verbose: bool) -> str:
-        """Format a single driver prediction."""
-        lines = []
-        
+    def _iter_single_prediction(
+        self,
+        rank: int,
+        prediction: DriverPrediction,
+        verbose: bool
+    ) -> Iterator[str]:
+        """Yield the lines for a single driver prediction."""
         # Driver header
         driver_name = f"{prediction.driver.forename} {prediction.driver.surname}"
-        team_name = prediction.constructor.name
-        lines.append(f"{rank}. {driver_name} ({team_name})")
-        lines.append(f"   Confidence: {prediction.confidence:.1f}%")
-        lines.append("")
+        yield f"{rank}. {driver_name} ({prediction.constructor.name})"
+        yield f"   Confidence: {prediction.confidence:.1f}%"
+        yield ""
         
         # Key factors
         if verbose:
-            lines.append("   Detailed Factors:")
-            lines.append(self.format_factors(prediction))
+            yield "   Detailed Factors:"
+            factor_lines = list(self._iter_factors(prediction))
+            # An empty factor list still leaves its (blank) line
+            yield from factor_lines or ("",)
         else:
-            lines.append("   Key Factors:")
-            for reason in prediction.reasoning:
-                lines.append(f"   • {reason}")
-        
-        return "\n".join(lines)
+            yield "   Key Factors:"
+            if prediction.reasoning_block:
+                yield prediction.reasoning_block
+            else:
+                for reason in prediction.reasoning:
+                    yield f"   • {reason}"
     
     def format_factors(self, prediction: DriverPrediction) -> str:
         """
@@ -81,23 +130,14 @@ class ResultFormatter:
         Returns:
             Formatted string showing all factor scores
         """
-        lines = []
-        
-        # Define factor display names and order
-        factor_names = {
-            'championship': 'Championship Position',
-            'form': 'Recent Form',
-            'team': 'Team Performance',
-            'qualifying': 'Qualifying Position',
-            'circuit': 'Circuit History'
-        }
-        
-        for key, display_name in factor_names.items():
-            if key in prediction.factors:
-                score = prediction.factors[key]
-                lines.append(f"   • {display_name}: {score:.1f}/100")
-        
-        return "\n".join(lines)
+        return "\n".join(self._iter_factors(prediction))
+    
+    def _iter_factors(self, prediction: DriverPrediction) -> Iterator[str]:
+        """Yield one line per factor score present in the prediction."""
+        factors = prediction.factors
+        for key, display_name in _FACTOR_NAMES:
+            if key in factors:
+                yield f"   • {display_name}: {factors[key]:.1f}/100"
     
     def format_table(self, predictions: List[DriverPrediction]) -> str:
         """
@@ -109,26 +149,13 @@ class ResultFormatter:
         Returns:
             Formatted ASCII table string
         """
-        # Table header
-        lines = []
-        lines.append("┌──────┬─────────────────────────┬──────────────────────┬────────────┐")
-        lines.append("│ Rank │ Driver                  │ Team                 │ Confidence │")
-        lines.append("├──────┼─────────────────────────┼──────────────────────┼────────────┤")
-        
-        # Table rows
-        for i, prediction in enumerate(predictions, 1):
-            driver_name = f"{prediction.driver.forename} {prediction.driver.surname}"
-            team_name = prediction.constructor.name
-            confidence = f"{prediction.confidence:.1f}%"
-            
-            # Truncate if needed to fit column widths
-            driver_name = driver_name[:23].ljust(23)
-            team_name = team_name[:20].ljust(20)
-            confidence = confidence.rjust(10)
-            
-            lines.append(f"│  {i:<2}  │ {driver_name} │ {team_name} │ {confidence} │")
-        
-        # Table footer
-        lines.append("└──────┴─────────────────────────┴──────────────────────┴────────────┘")
-        
-        return "\n".join(lines)
+        rows = [
+            _TABLE_ROW.format(
+                rank=i,
+                driver=f"{prediction.driver.forename} {prediction.driver.surname}",
+                team=prediction.constructor.name,
+                confidence=f"{prediction.confidence:.1f}%"
+            )
+            for i, prediction in enumerate(predictions, 1)
+        ]
+        return "\n".join((_TABLE_HEADER, *rows, _TABLE_FOOTER))
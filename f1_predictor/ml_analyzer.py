@@ -1,7 +1,7 @@
 """
 Machine Learning-based prediction analyzer.
 
-Uses trained Random Forest model to predict race winners instead of fixed weights.
+Uses a trained tree ensemble to predict race winners instead of fixed weights.
 Falls back to statistical analysis if model is not available.
 """
 
@@ -11,6 +11,11 @@ import os
 from typing import List, Dict, Optional
 import numpy as np
 
+try:
+    import joblib  # Ships with scikit-learn: memory-maps the model's arrays on load
+except ImportError:
+    joblib = None
+
 from f1_predictor.models import (
     Race, Driver, Constructor, RaceResult, QualifyingResult,
     DriverStanding, ConstructorStanding, DriverPrediction
@@ -18,8 +23,6 @@ from f1_predictor.models import (
 from f1_predictor.analyzer import PredictionAnalyzer
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -27,13 +30,16 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
     """
     Machine Learning-based analyzer that extends the statistical analyzer.
     
-    Uses a trained Random Forest model to predict race winners. If the model
+    Uses a trained tree ensemble to predict race winners. If the model
     is not available, falls back to the statistical method from parent class.
     
     The ML model learns optimal feature weights from historical data instead
     of using fixed weights.
     """
     
+    # Minimum number of championship front-runners scored by the model
+    CANDIDATE_POOL_MIN = 10
+    
     def __init__(self, model_path: str = 'models/f1_predictor.pkl'):
         """
         Initialize ML analyzer.
@@ -59,8 +65,17 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
             return
         
         try:
-            with open(self.model_path, 'rb') as f:
-                self.model = pickle.load(f)
+            if joblib is not None:
+                # Large arrays are paged in on demand and shared between
+                # processes; plain pickle files load here too
+                self.model = joblib.load(self.model_path, mmap_mode='r')
+            else:
+                with open(self.model_path, 'rb') as f:
+                    self.model = pickle.load(f)
+            # Models trained with n_jobs=-1 would start a thread pool on every
+            # predict, which costs more than it saves for a grid-sized batch
+            if hasattr(self.model, 'n_jobs'):
+                self.model.n_jobs = 1
             self.model_loaded = True
             logger.info(f"ML model loaded successfully from {self.model_path}")
         except Exception as e:
@@ -77,7 +92,11 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
         recent_results: List[RaceResult],
         qualifying_position: Optional[int],
         circuit_history: Optional[List[RaceResult]],
-        race: Race
+        race: Race,
+        championship_scores: Optional[Dict[str, float]] = None,
+        team_scores: Optional[Dict[str, float]] = None,
+        recent_by_driver: Optional[Dict[str, List[RaceResult]]] = None,
+        circuit_by_driver: Optional[Dict[str, List[RaceResult]]] = None
     ) -> np.ndarray:
         """
         Extract feature vector for a single driver.
@@ -95,14 +114,35 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
             qualifying_position: Qualifying position (if available)
             circuit_history: Historical results at circuit (if available)
             race: Race being predicted
+            championship_scores: Optional precomputed championship scores keyed by driver ID
+            team_scores: Optional precomputed team scores keyed by constructor ID
+            recent_by_driver: Optional recent results grouped by driver ID, most recent first
+            circuit_by_driver: Optional circuit history grouped by driver ID
             
         Returns:
             Numpy array of features [championship, form, team, qualifying, circuit]
         """
-        # Calculate same features as statistical model
-        championship_score = self.calculate_championship_score(driver, driver_standings)
-        form_score = self.calculate_driver_form(driver, recent_results)
-        team_score = self.calculate_team_performance(constructor, constructor_standings)
+        driver_id = driver.driver_id
+        
+        # Calculate same features as statistical model, reusing precomputed
+        # scores and per-driver result groups when analyze() provides them
+        championship_score = None
+        if championship_scores is not None:
+            championship_score = championship_scores.get(driver_id)
+        if championship_score is None:
+            championship_score = self.calculate_championship_score(driver, driver_standings)
+        
+        form_score = self.calculate_driver_form(
+            driver, recent_results,
+            driver_results=(
+                recent_by_driver.get(driver_id, []) if recent_by_driver is not None else None
+            )
+        )
+        
+        if team_scores is not None:
+            team_score = team_scores.get(constructor.constructor_id, 50.0)
+        else:
+            team_score = self.calculate_team_performance(constructor, constructor_standings)
         
         # Qualifying score
         if qualifying_position:
@@ -113,7 +153,10 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
         # Circuit history score
         if circuit_history:
             circuit_score = self.calculate_circuit_advantage(
-                driver, race.circuit.circuit_id, circuit_history
+                driver, race.circuit.circuit_id, circuit_history,
+                driver_results=(
+                    circuit_by_driver.get(driver_id, []) if circuit_by_driver is not None else None
+                )
             )
         else:
             circuit_score = 50.0  # Neutral if not available
@@ -172,20 +215,46 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
         logger.info(f"Analyzing race with ML model: {race.race_name}")
         
         # Track data completeness
-        total_factors = 5
-        available_factors = 3  # Championship, form, and team always available
-        if qualifying_results:
-            available_factors += 1
-        if circuit_history:
-            available_factors += 1
-        
-        data_completeness = available_factors / total_factors
+        data_completeness = self.calculate_data_completeness(
+            driver_standings, constructor_standings, recent_results,
+            qualifying_results, circuit_history
+        )
         logger.info(f"Data completeness: {data_completeness:.1%}")
         
-        predictions = []
+        # Score standings-based factors and group results once, rather than
+        # rescanning the standings, qualifying and result lists per driver
+        championship_context = self.build_championship_context(driver_standings)
+        championship_scores: Dict[str, float] = {
+            driver_id: self.calculate_championship_score(
+                standing.driver, driver_standings, context=championship_context
+            )
+            for driver_id, standing in championship_context.standings_by_id.items()
+        }
+        team_context = self.build_team_context(constructor_standings or [])
+        team_scores: Dict[str, float] = {
+            constructor_id: self.calculate_team_performance(
+                standing.constructor, constructor_standings, context=team_context
+            )
+            for constructor_id, standing in team_context.standings_by_id.items()
+        }
+        qualifying_positions: Dict[str, int] = {}
+        for qual_result in qualifying_results or []:
+            qualifying_positions.setdefault(qual_result.driver_id, qual_result.position)
+        
+        recent_by_driver = self._group_by_driver(recent_results or [])
+        for driver_results in recent_by_driver.values():
+            driver_results.sort(key=lambda r: r.race.date_ord, reverse=True)
+        circuit_by_driver = self._group_by_driver(circuit_history or [])
+        
+        # Every feature tracks championship position closely, so drivers far
+        # down the standings cannot realistically win; only score the leaders
+        pool_size = max(2 * top_n, self.CANDIDATE_POOL_MIN)
+        candidate_standings = sorted(driver_standings, key=lambda s: s.position)[:pool_size]
         
-        # Extract features and predict for each driver
-        for driver_standing in driver_standings:
+        # First pass: extract one feature row per valid driver
+        candidates = []
+        feat_matrix = np.empty((len(candidate_standings), 5), dtype=np.float32)
+        for driver_standing in candidate_standings:
             try:
                 driver = driver_standing.driver
                 constructor = driver_standing.constructor
@@ -197,12 +266,7 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
                     continue
                 
                 # Find qualifying position if available
-                qualifying_position = None
-                if qualifying_results:
-                    for qual_result in qualifying_results:
-                        if qual_result.driver.driver_id == driver.driver_id:
-                            qualifying_position = qual_result.position
-                            break
+                qualifying_position = qualifying_positions.get(driver.driver_id)
                 
                 # Extract features
                 features = self._extract_features_for_driver(
@@ -214,35 +278,55 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
                     recent_results=recent_results,
                     qualifying_position=qualifying_position,
                     circuit_history=circuit_history,
-                    race=race
+                    race=race,
+                    championship_scores=championship_scores,
+                    team_scores=team_scores,
+                    recent_by_driver=recent_by_driver,
+                    circuit_by_driver=circuit_by_driver
                 )
                 
-                # Predict using ML model
-                # Reshape for single prediction: (1, n_features)
-                features_reshaped = features.reshape(1, -1)
-                
-                # Get probability prediction
-                # predict_proba returns [[prob_class_0, prob_class_1]]
-                # We want the probability of winning (class 1)
-                prediction_proba = self.model.predict_proba(features_reshaped)
-                win_probability = prediction_proba[0][1]  # Probability of class 1 (win)
-                
-                # Convert to confidence score (0-100)
-                confidence = win_probability * 100
-                
-                # Adjust for data completeness
-                confidence = confidence * data_completeness
+                feat_matrix[len(candidates)] = features
+                candidates.append((driver_standing, qualifying_position, features))
                 
-                # Create factors dict for reasoning (same as statistical)
-                factors = {
-                    'championship': features[0],
-                    'form': features[1],
-                    'team': features[2],
-                    'qualifying': features[3],
-                    'circuit': features[4]
-                }
-                
-                # Generate reasoning
+            except Exception as e:
+                logger.error(f"Failed to generate ML prediction for driver: {e}")
+                continue
+        
+        if not candidates:
+            return []
+        
+        # Predict every driver in one call; per-row calls pay the model's
+        # dispatch overhead each time.
+        # predict_proba returns [[prob_class_0, prob_class_1], ...]
+        # We want the probability of winning (class 1), as a 0-100 confidence
+        # adjusted for data completeness (scalars folded first: one vector multiply)
+        win_probabilities = self.model.predict_proba(feat_matrix[:len(candidates)])[:, 1]
+        confidences = win_probabilities * (100.0 * data_completeness)
+        
+        # Rank by confidence (highest first; the stable sort keeps standings
+        # order for ties)
+        ranked = np.argsort(-confidences, kind='stable')[:top_n]
+        
+        # Build reasoning and predictions only for the top N drivers
+        top_predictions = []
+        for i in ranked:
+            driver_standing, qualifying_position, features = candidates[i]
+            driver = driver_standing.driver
+            constructor = driver_standing.constructor
+            confidence = confidences[i]
+            
+            # Create factors dict for reasoning (same as statistical)
+            factors = {
+                'championship': features[0],
+                'form': features[1],
+                'team': features[2],
+                'qualifying': features[3],
+                'circuit': features[4]
+            }
+            
+            # Generate reasoning from the already grouped results
+            try:
+                driver_id = driver.driver_id
                 reasoning = self.generate_reasoning(
                     driver=driver,
                     constructor=constructor,
@@ -250,34 +334,30 @@ class MLPredictionAnalyzer(PredictionAnalyzer):
                     driver_standing=driver_standing,
                     qualifying_position=qualifying_position,
                     recent_results=recent_results,
-                    circuit_history=circuit_history
-                )
-                
-                # Add ML-specific note
-                reasoning.insert(0, f"ML Model Confidence: {confidence:.1f}%")
-                
-                # Create prediction
-                prediction = DriverPrediction(
-                    driver=driver,
-                    constructor=constructor,
-                    confidence=confidence,
-                    factors=factors,
-                    reasoning=reasoning
+                    circuit_history=circuit_history,
+                    form_summary=self.summarize_results(
+                        recent_by_driver.get(driver_id, [])[:self.RECENT_RACES_COUNT]
+                    ),
+                    circuit_summary=self.summarize_results(circuit_by_driver.get(driver_id, []))
                 )
-                
-                predictions.append(prediction)
-                
             except Exception as e:
-                logger.error(f"Failed to generate ML prediction for driver: {e}")
-                continue
-        
-        # Sort by confidence (highest first)
-        predictions.sort(key=lambda p: p.confidence, reverse=True)
-        
-        # Return top N predictions
-        top_predictions = predictions[:top_n]
+                logger.warning(f"Failed to generate reasoning: {e}")
+                reasoning = []
+            
+            # Add ML-specific note
+            reasoning.insert(0, f"ML Model Confidence: {confidence:.1f}%")
+            
+            # Create prediction
+            top_predictions.append(DriverPrediction(
+                driver=driver,
+                constructor=constructor,
+                confidence=confidence,
+                factors=factors,
+                reasoning=reasoning,
+                reasoning_block=self.build_reasoning_block(reasoning)
+            ))
         
-        logger.info(f"Generated {len(predictions)} ML predictions, returning top {top_n}")
+        logger.info(f"Generated {len(candidates)} ML predictions, returning top {top_n}")
         for i, pred in enumerate(top_predictions, 1):
             logger.info(
                 f"{i}. {pred.driver.surname} ({pred.constructor.name}): "
@@ -1,23 +1,43 @@
 """Data models for F1 Race Predictor."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Any, Optional, Dict, List
 
 
+class _FrozenSlots:
+    """
+    Pickle support for frozen dataclasses that declare __slots__.
+    
+    Slotted instances have no __dict__, so the default unpickling path
+    restores them with setattr(), which frozen dataclasses reject.
+    """
+    __slots__ = ()
+    
+    def __getstate__(self) -> List[Any]:
+        return [getattr(self, name) for name in self.__slots__]
+    
+    def __setstate__(self, state: List[Any]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
-@dataclass
-class Circuit:
+
+@dataclass(frozen=True)
+class Circuit(_FrozenSlots):
     """Represents an F1 circuit."""
+    __slots__ = ('circuit_id', 'circuit_name', 'location', 'country')
+    
     circuit_id: str
     circuit_name: str
     location: str
     country: str
 
 
-@dataclass
-class Driver:
+@dataclass(frozen=True)
+class Driver(_FrozenSlots):
     """Represents an F1 driver."""
+    __slots__ = ('driver_id', 'code', 'forename', 'surname', 'nationality')
+    
     driver_id: str
     code: str  # e.g., "VER", "HAM"
     forename: str
@@ -25,27 +45,42 @@ class Driver:
     nationality: str
 
 
-@dataclass
-class Constructor:
+@dataclass(frozen=True)
+class Constructor(_FrozenSlots):
     """Represents an F1 constructor/team."""
+    __slots__ = ('constructor_id', 'name', 'nationality')
+    
     constructor_id: str
     name: str
     nationality: str
 
 
-@dataclass
-class Race:
+@dataclass(frozen=True)
+class Race(_FrozenSlots):
     """Represents an F1 race."""
+    # date_ord is not a dataclass field; it caches date.toordinal()
+    __slots__ = ('season', 'round', 'race_name', 'circuit', 'date', 'date_ord')
+    
     season: int
     round: int
     race_name: str
     circuit: Circuit
     date: datetime
+    
+    def __post_init__(self):
+        # Integer sort key (races never share a calendar day)
+        object.__setattr__(self, 'date_ord', self.date.toordinal() if self.date else 0)
 
 
-@dataclass
-class RaceResult:
+@dataclass(frozen=True)
+class RaceResult(_FrozenSlots):
     """Represents a race result for a driver."""
+    # driver_id is not a dataclass field; it caches driver.driver_id
+    __slots__ = (
+        'race', 'driver', 'constructor', 'position', 'points', 'grid', 'laps', 'status',
+        'driver_id'
+    )
+    
     race: Race
     driver: Driver
     constructor: Constructor
@@ -54,11 +89,21 @@ class RaceResult:
     grid: int
     laps: int
     status: str
+    
+    def __post_init__(self) -> None:
+        """Cache the driver ID for fast filtering by driver."""
+        object.__setattr__(self, 'driver_id', self.driver.driver_id if self.driver else "")
 
 
-@dataclass
-class QualifyingResult:
+@dataclass(frozen=True)
+class QualifyingResult(_FrozenSlots):
     """Represents a qualifying result for a driver."""
+    # driver_id is not a dataclass field; it caches driver.driver_id
+    __slots__ = (
+        'race', 'driver', 'constructor', 'position', 'q1_time', 'q2_time', 'q3_time',
+        'driver_id'
+    )
+    
     race: Race
     driver: Driver
     constructor: Constructor
@@ -66,11 +111,17 @@ class QualifyingResult:
     q1_time: Optional[str]
     q2_time: Optional[str]
     q3_time: Optional[str]
+    
+    def __post_init__(self) -> None:
+        """Cache the driver ID for fast filtering by driver."""
+        object.__setattr__(self, 'driver_id', self.driver.driver_id if self.driver else "")
 
 
-@dataclass
-class DriverStanding:
+@dataclass(frozen=True)
+class DriverStanding(_FrozenSlots):
     """Represents a driver's championship standing."""
+    __slots__ = ('driver', 'constructor', 'position', 'points', 'wins')
+    
     driver: Driver
     constructor: Constructor
     position: int
@@ -78,9 +129,11 @@ class DriverStanding:
     wins: int
 
 
-@dataclass
-class ConstructorStanding:
+@dataclass(frozen=True)
+class ConstructorStanding(_FrozenSlots):
     """Represents a constructor's championship standing."""
+    __slots__ = ('constructor', 'position', 'points', 'wins')
+    
     constructor: Constructor
     position: int
     points: float
@@ -95,6 +148,7 @@ class DriverPrediction:
     confidence: float  # 0-100
     factors: Dict[str, float]  # Individual factor scores
     reasoning: List[str]  # Human-readable explanations
+    reasoning_block: str = ""  # Preformatted bulleted reasoning for display
 
 
 @dataclass
@@ -105,6 +159,10 @@ class PredictionResult:
     generated_at: datetime
     data_sources: List[str]
     data_completeness: float  # 0-1
+    # Formatted output keyed by verbose flag, filled in by ResultFormatter
+    _formatted_cache: Dict[bool, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 @dataclass